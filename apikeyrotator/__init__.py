@@ -7,78 +7,74 @@ Easy-to-use yet feature-rich API key rotator with support for:
 - Middleware system
 - Metrics and monitoring
 - Automatic retry and error handling
+
+Public names are imported lazily on first attribute access (PEP 562),
+so e.g. ``from apikeyrotator import ConfigLoader`` does not pull in
+the HTTP clients, middleware or secret providers.
 """
 
-# Core
-from .core import (
-    APIKeyRotator,
-    AsyncAPIKeyRotator,
-    parse_keys,
-    ConfigLoader,
-)
+import importlib
+from typing import TYPE_CHECKING, Any, List
 
-from .core.exceptions import (
-    APIKeyError,
-    NoAPIKeysError,
-    AllKeysExhaustedError,
-    AllProvidersExhaustedError,
-)
+__version__ = "0.6.1"
+__author__ = "Prime Evolution"
 
-# Strategies
-from .strategies import (
-    RotationStrategy,
-    create_rotation_strategy,
-    BaseRotationStrategy,
-    RoundRobinRotationStrategy,
-    RandomRotationStrategy,
-    WeightedRotationStrategy,
-    LRURotationStrategy,
-    HealthBasedStrategy,
-    KeyMetrics,
-)
+# Public name -> module that defines it
+_LAZY_IMPORTS = {
+    # Core
+    "APIKeyRotator": "apikeyrotator.core.rotator",
+    "AsyncAPIKeyRotator": "apikeyrotator.core.rotator",
+    "parse_keys": "apikeyrotator.core.key_parser",
+    "ConfigLoader": "apikeyrotator.core.config_loader",
+    "APIKeyError": "apikeyrotator.core.exceptions",
+    "NoAPIKeysError": "apikeyrotator.core.exceptions",
+    "AllKeysExhaustedError": "apikeyrotator.core.exceptions",
+    "AllProvidersExhaustedError": "apikeyrotator.core.exceptions",
 
-# Router
-from .router import FallbackRouter, ProviderRoute
+    # Strategies
+    "RotationStrategy": "apikeyrotator.strategies",
+    "create_rotation_strategy": "apikeyrotator.strategies",
+    "BaseRotationStrategy": "apikeyrotator.strategies",
+    "RoundRobinRotationStrategy": "apikeyrotator.strategies",
+    "RandomRotationStrategy": "apikeyrotator.strategies",
+    "WeightedRotationStrategy": "apikeyrotator.strategies",
+    "LRURotationStrategy": "apikeyrotator.strategies",
+    "HealthBasedStrategy": "apikeyrotator.strategies",
+    "KeyMetrics": "apikeyrotator.strategies",
 
-# Providers
-from .providers import (
-    SecretProvider,
-    create_secret_provider,
-    EnvironmentSecretProvider,
-    FileSecretProvider,
-    AWSSecretsManagerProvider,
-)
+    # Router
+    "FallbackRouter": "apikeyrotator.router",
+    "ProviderRoute": "apikeyrotator.router",
 
-# Middleware
-from .middleware import (
-    RotatorMiddleware,
-    RequestInfo,
-    ResponseInfo,
-    ErrorInfo,
-    LoggingMiddleware,
-    CachingMiddleware,
-    RateLimitMiddleware,
-)
+    # Providers
+    "SecretProvider": "apikeyrotator.providers",
+    "create_secret_provider": "apikeyrotator.providers",
+    "EnvironmentSecretProvider": "apikeyrotator.providers",
+    "FileSecretProvider": "apikeyrotator.providers",
+    "AWSSecretsManagerProvider": "apikeyrotator.providers",
 
-# Metrics
-from .metrics import (
-    RotatorMetrics,
-    EndpointStats,
-    PrometheusExporter,
-)
+    # Middleware
+    "RotatorMiddleware": "apikeyrotator.middleware",
+    "RequestInfo": "apikeyrotator.middleware",
+    "ResponseInfo": "apikeyrotator.middleware",
+    "ErrorInfo": "apikeyrotator.middleware",
+    "LoggingMiddleware": "apikeyrotator.middleware",
+    "CachingMiddleware": "apikeyrotator.middleware",
+    "RateLimitMiddleware": "apikeyrotator.middleware",
 
-# Utils
-from .utils import (
-    ErrorClassifier,
-    ErrorType,
-    retry_with_backoff,
-    async_retry_with_backoff,
-)
+    # Metrics
+    "RotatorMetrics": "apikeyrotator.metrics",
+    "EndpointStats": "apikeyrotator.metrics",
+    "PrometheusExporter": "apikeyrotator.metrics",
 
-__version__ = "0.6.1"
-__author__ = "Prime Evolution"
+    # Utils
+    "ErrorClassifier": "apikeyrotator.utils",
+    "ErrorType": "apikeyrotator.utils",
+    "retry_with_backoff": "apikeyrotator.utils",
+    "async_retry_with_backoff": "apikeyrotator.utils",
+}
 
-__all__ = [
+__all__ = (
     # Core
     "APIKeyRotator",
     "AsyncAPIKeyRotator",
@@ -130,4 +126,63 @@ __all__ = [
     "ErrorType",
     "retry_with_backoff",
     "async_retry_with_backoff",
-]
\ No newline at end of file
+)
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    # Cache on the package so later lookups bypass __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
+
+
+if TYPE_CHECKING:
+    from .core import APIKeyRotator, AsyncAPIKeyRotator, parse_keys, ConfigLoader
+    from .core.exceptions import (
+        APIKeyError,
+        NoAPIKeysError,
+        AllKeysExhaustedError,
+        AllProvidersExhaustedError,
+    )
+    from .strategies import (
+        RotationStrategy,
+        create_rotation_strategy,
+        BaseRotationStrategy,
+        RoundRobinRotationStrategy,
+        RandomRotationStrategy,
+        WeightedRotationStrategy,
+        LRURotationStrategy,
+        HealthBasedStrategy,
+        KeyMetrics,
+    )
+    from .router import FallbackRouter, ProviderRoute
+    from .providers import (
+        SecretProvider,
+        create_secret_provider,
+        EnvironmentSecretProvider,
+        FileSecretProvider,
+        AWSSecretsManagerProvider,
+    )
+    from .middleware import (
+        RotatorMiddleware,
+        RequestInfo,
+        ResponseInfo,
+        ErrorInfo,
+        LoggingMiddleware,
+        CachingMiddleware,
+        RateLimitMiddleware,
+    )
+    from .metrics import RotatorMetrics, EndpointStats, PrometheusExporter
+    from .utils import (
+        ErrorClassifier,
+        ErrorType,
+        retry_with_backoff,
+        async_retry_with_backoff,
+    )
@@ -1,9 +1,18 @@
-from .rotator import APIKeyRotator, AsyncAPIKeyRotator
-from .exceptions import APIKeyError, NoAPIKeysError, AllKeysExhaustedError
-from .key_parser import parse_keys
-from .config_loader import ConfigLoader
+import importlib
+from typing import TYPE_CHECKING, Any, List
 
-__all__ = [
+# Public name -> submodule; resolved lazily on first access (PEP 562)
+_LAZY_IMPORTS = {
+    "APIKeyRotator": ".rotator",
+    "AsyncAPIKeyRotator": ".rotator",
+    "APIKeyError": ".exceptions",
+    "NoAPIKeysError": ".exceptions",
+    "AllKeysExhaustedError": ".exceptions",
+    "parse_keys": ".key_parser",
+    "ConfigLoader": ".config_loader",
+}
+
+__all__ = (
     "APIKeyRotator",
     "AsyncAPIKeyRotator",
     "APIKeyError",
@@ -11,4 +20,24 @@ __all__ = [
     "AllKeysExhaustedError",
     "parse_keys",
     "ConfigLoader",
-]
+)
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
+
+
+if TYPE_CHECKING:
+    from .rotator import APIKeyRotator, AsyncAPIKeyRotator
+    from .exceptions import APIKeyError, NoAPIKeysError, AllKeysExhaustedError
+    from .key_parser import parse_keys
+    from .config_loader import ConfigLoader
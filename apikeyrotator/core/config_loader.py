@@ -1,9 +1,154 @@
 import os
+import sys
+import copy
+import functools
+import hashlib
 import json
-import yaml
-from typing import Dict, Any, List, Optional
+import mmap
+import tempfile
+import threading
+from collections import OrderedDict
+from typing import Dict, Any, Callable, Iterable, List, Optional, Tuple
 import logging
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# PyYAML is imported on first use so JSON-only users never pay for it
+_yaml = None
+_YamlLoader = None
+_YamlDumper = None
+
+
+def _get_yaml():
+    """
+    Imports PyYAML on first call and caches the module with its loader/dumper.
+
+    Prefers the libyaml C bindings, which are an order of magnitude faster
+    than the pure-Python implementation.
+    """
+    global _yaml, _YamlLoader, _YamlDumper
+    if _yaml is None:
+        import yaml
+        try:
+            from yaml import CSafeLoader as loader, CSafeDumper as dumper
+        except ImportError:
+            from yaml import SafeLoader as loader, SafeDumper as dumper
+        _YamlLoader, _YamlDumper = loader, dumper
+        _yaml = yaml
+    return _yaml, _YamlLoader, _YamlDumper
+
+
+if orjson is not None:
+    # orjson works on UTF-8 bytes directly, skipping the text decode/encode
+    def _json_loads(data: bytes) -> Any:
+        return orjson.loads(data)
+
+    def _json_dumps(config: Dict[str, Any]) -> bytes:
+        return orjson.dumps(config, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+else:
+    # Built once: json.dumps() with non-default options constructs a new
+    # JSONEncoder on every call
+    _JSON_ENCODER = json.JSONEncoder(indent=4, ensure_ascii=False)
+
+    def _json_loads(data: bytes) -> Any:
+        return json.loads(data)
+
+    def _json_dumps(config: Dict[str, Any]) -> bytes:
+        return _JSON_ENCODER.encode(config).encode('utf-8')
+
+
+def _intern_keys(obj: Any) -> Any:
+    """Rebuilds mappings with interned string keys so repeated keys share storage."""
+    if isinstance(obj, dict):
+        return {
+            (sys.intern(k) if isinstance(k, str) else k): _intern_keys(v)
+            for k, v in obj.items()
+        }
+    if isinstance(obj, list):
+        return [_intern_keys(item) for item in obj]
+    return obj
+
+
+def _yaml_loads(data: bytes) -> Any:
+    yaml, loader, _ = _get_yaml()
+    # json and orjson already reuse key strings within a document; PyYAML does not
+    return _intern_keys(yaml.load(data, Loader=loader)) or {}
+
+
+def _yaml_dumps(config: Dict[str, Any]) -> bytes:
+    yaml, _, dumper = _get_yaml()
+    return yaml.dump(config, Dumper=dumper, indent=4, allow_unicode=True, encoding='utf-8')
+
+
+_Loads = Callable[[bytes], Any]
+_Dumps = Callable[[Dict[str, Any]], bytes]
+
+# Extension -> (loads(bytes), dumps() -> bytes)
+_FORMATS: Dict[str, Tuple[_Loads, _Dumps]] = {
+    '.json': (_json_loads, _json_dumps),
+    '.yaml': (_yaml_loads, _yaml_dumps),
+    '.yml': (_yaml_loads, _yaml_dumps),
+}
+
+
+@functools.lru_cache(maxsize=None)
+def _resolve_format(ext: str) -> Tuple[Optional[_Loads], Optional[_Dumps]]:
+    """
+    Returns the (loads, dumps) pair for a file extension, memoized per process.
+
+    Returns (None, None) for unsupported extensions.
+    """
+    return _FORMATS.get(ext.lower(), (None, None))
+
+
+def _read_file_bytes(path: str, size: int) -> bytes:
+    """
+    Reads a file as raw bytes with os.read on the descriptor, sized from a
+    prior stat, bypassing the buffered/text I/O layers entirely.
+    """
+    fd = os.open(path, os.O_RDONLY | getattr(os, 'O_BINARY', 0))
+    try:
+        chunks = []
+        remaining = size
+        while remaining > 0:
+            chunk = os.read(fd, remaining)
+            if not chunk:
+                break
+            chunks.append(chunk)
+            remaining -= len(chunk)
+        return b''.join(chunks)
+    finally:
+        os.close(fd)
+
+
+# JSON files at least this large are parsed from an mmap instead of a read copy
+_MMAP_THRESHOLD = 64 * 1024
+
+
+def _load_json_mapped(path: str) -> Any:
+    """Parses a JSON file with orjson directly from a read-only memory map."""
+    with open(path, 'rb') as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            with memoryview(mm) as view:
+                return orjson.loads(view)
+
+
+# Parsed configs shared across loaders, keyed on (abspath, mtime_ns, size).
+# Each entry is a factory returning a fresh, caller-owned copy of the config.
+_PARSE_CACHE: "OrderedDict[Tuple[str, int, int], Callable[[], Dict[str, Any]]]" = OrderedDict()
+_PARSE_CACHE_MAX_SIZE = 32
+_PARSE_CACHE_LOCK = threading.Lock()
+
+
+def _invalidate_parse_cache(path: str) -> None:
+    """Drops every cached parse result for the given file."""
+    with _PARSE_CACHE_LOCK:
+        for cache_key in [k for k in _PARSE_CACHE if k[0] == path]:
+            del _PARSE_CACHE[cache_key]
+
 
 class ConfigLoader:
     """
@@ -18,17 +163,37 @@ class ConfigLoader:
         config (Dict[str, Any]): Loaded configuration
     """
 
-    def __init__(self, config_file: str, logger: Optional[logging.Logger] = None):
+    def __init__(
+            self,
+            config_file: str,
+            logger: Optional[logging.Logger] = None,
+            autosave: bool = True
+    ):
         """
         Initializes the configuration loader.
 
         Args:
             config_file: Path to the configuration file (.json, .yaml, .yml)
             logger: Optional logger for output messages
+            autosave: Whether update_config writes the file immediately.
+                      If False, updates are kept in memory until flush()
         """
         self.config_file = config_file
         self.logger = logger
         self.config: Dict[str, Any] = {}
+        self.autosave = autosave
+        self._dirty = False
+        # (payload digest, st_mtime_ns, st_size) of the last successful save
+        self._last_saved: Optional[Tuple[bytes, int, int]] = None
+
+        # Resolve the format once; unsupported formats fail at load/save time
+        self._ext = os.path.splitext(config_file)[1].lower()
+        self._load_fn, self._dump_fn = _resolve_format(self._ext)
+
+    def _unsupported_format_error(self) -> ValueError:
+        return ValueError(
+            f"Unsupported config file format: {self._ext}. Only .json, .yaml, .yml are supported."
+        )
 
     def load_config(self) -> Dict[str, Any]:
         """
@@ -36,6 +201,8 @@ class ConfigLoader:
 
         Automatically detects file format by extension.
         If the file does not exist, returns an empty dictionary.
+        Repeated loads of an unchanged file (same mtime and size)
+        are served from an in-memory cache without re-parsing.
 
         Returns:
             Dict[str, Any]: Loaded configuration
@@ -43,31 +210,88 @@ class ConfigLoader:
         Raises:
             ValueError: If the file format is not supported
         """
-        if not os.path.exists(self.config_file):
-            if self.logger:
-                self.logger.debug(f"Config file {self.config_file} does not exist, returning empty config")
-            return {}
-
-        _, ext = os.path.splitext(self.config_file)
-        ext = ext.lower()
-
         try:
-            with open(self.config_file, 'r', encoding='utf-8') as f:
-                if ext == '.json':
-                    self.config = json.load(f)
-                elif ext in ('.yaml', '.yml'):
-                    self.config = yaml.safe_load(f) or {}
+            st = os.stat(self.config_file)
+            cache_key = (os.path.abspath(self.config_file), st.st_mtime_ns, st.st_size)
+            with _PARSE_CACHE_LOCK:
+                fresh_copy = _PARSE_CACHE.get(cache_key)
+                if fresh_copy is not None:
+                    _PARSE_CACHE.move_to_end(cache_key)
+            if fresh_copy is not None:
+                # Always a new tree, so callers mutating self.config can't corrupt the cache
+                self.config = fresh_copy()
+                if self.logger:
+                    self.logger.debug(f"Loaded config from cache for {self.config_file}")
+                return self.config
+
+            if self._load_fn is None:
+                raise self._unsupported_format_error()
+            use_orjson = self._ext == '.json' and orjson is not None
+            if use_orjson and st.st_size >= _MMAP_THRESHOLD:
+                # Large files are parsed straight from the page cache; the cache
+                # keeps the parsed tree so hits never re-parse the file
+                self.config = _load_json_mapped(self.config_file)
+                fresh_copy = functools.partial(copy.deepcopy, copy.deepcopy(self.config))
+            else:
+                data = _read_file_bytes(self.config_file, st.st_size)
+                self.config = self._load_fn(data)
+                if use_orjson:
+                    # Re-decoding the retained bytes with orjson is several times
+                    # cheaper than copy.deepcopy of the parsed tree
+                    fresh_copy = functools.partial(orjson.loads, data)
                 else:
-                    raise ValueError(f"Unsupported config file format: {ext}. Only .json, .yaml, .yml are supported.")
+                    fresh_copy = functools.partial(copy.deepcopy, copy.deepcopy(self.config))
+
+            with _PARSE_CACHE_LOCK:
+                _PARSE_CACHE[cache_key] = fresh_copy
+                while len(_PARSE_CACHE) > _PARSE_CACHE_MAX_SIZE:
+                    _PARSE_CACHE.popitem(last=False)
 
             if self.logger:
                 self.logger.debug(f"Loaded config from {self.config_file}")
             return self.config
+        except FileNotFoundError:
+            # A single stat/open replaces the exists() pre-check and its TOCTOU race
+            if self.logger:
+                self.logger.debug(f"Config file {self.config_file} does not exist, returning empty config")
+            return {}
         except Exception as e:
             if self.logger:
                 self.logger.error(f"Error loading config from {self.config_file}: {e}")
             return {}
 
+    def prefetch(self) -> None:
+        """
+        Asks the OS to start reading the config file into the page cache.
+
+        Call this early (e.g. at import time) to overlap disk latency with
+        other start-up work; a later load_config() then finds the pages
+        resident. Uses posix_fadvise(WILLNEED) where available and falls
+        back to reading the file on a daemon thread. Never raises.
+        """
+        if hasattr(os, 'posix_fadvise'):
+            try:
+                fd = os.open(self.config_file, os.O_RDONLY)
+            except OSError:
+                return
+            try:
+                os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+                return
+            except OSError:
+                pass
+            finally:
+                os.close(fd)
+
+        def _read_through():
+            try:
+                with open(self.config_file, 'rb') as f:
+                    while f.read(1024 * 1024):
+                        pass
+            except OSError:
+                pass
+
+        threading.Thread(target=_read_through, name="config-prefetch", daemon=True).start()
+
     def get(self, key: str, default: Any = None) -> Any:
         """
         Gets a value from the configuration by key.
@@ -81,62 +305,154 @@ class ConfigLoader:
         """
         return self.config.get(key, default)
 
-    def save_config(self, config: Optional[Dict[str, Any]] = None):
+    def save_config(self, config: Optional[Dict[str, Any]] = None) -> bool:
         """
         Saves the configuration to a file.
 
         Args:
             config: Configuration to save. If None, saves self.config
 
+        Returns:
+            bool: True if the file was written, False if it already held
+                  exactly these bytes
+
         Raises:
             ValueError: If the file format is not supported
         """
         if config is not None:
             self.config = config
 
-        _, ext = os.path.splitext(self.config_file)
-        ext = ext.lower()
-
         try:
+            if self._dump_fn is None:
+                raise self._unsupported_format_error()
+            payload = self._dump_fn(self.config)
+
+            # Skip the write + fsync when the file still holds exactly what we last wrote
+            digest = hashlib.blake2b(payload, digest_size=16).digest()
+            if self._is_saved_unchanged(digest):
+                self._dirty = False
+                if self.logger:
+                    self.logger.debug(f"Config unchanged, skipped saving {self.config_file}")
+                return False
+
+            _invalidate_parse_cache(os.path.abspath(self.config_file))
+
             # Create directory if it does not exist
             os.makedirs(os.path.dirname(self.config_file) or '.', exist_ok=True)
 
-            with open(self.config_file, 'w', encoding='utf-8') as f:
-                if ext == '.json':
-                    json.dump(self.config, f, indent=4, ensure_ascii=False)
-                elif ext in ('.yaml', '.yml'):
-                    yaml.safe_dump(self.config, f, indent=4, allow_unicode=True)
-                else:
-                    raise ValueError(f"Unsupported config file format: {ext}. Only .json, .yaml, .yml are supported.")
+            self._write_atomic(payload)
+            self._dirty = False
+
+            st = os.stat(self.config_file)
+            self._last_saved = (digest, st.st_mtime_ns, st.st_size)
 
             if self.logger:
                 self.logger.debug(f"Saved config to {self.config_file}")
+            return True
         except Exception as e:
             if self.logger:
                 self.logger.error(f"Error saving config to {self.config_file}: {e}")
             raise
 
-    def update_config(self, new_data: Dict[str, Any]):
+    def _is_saved_unchanged(self, digest: bytes) -> bool:
+        """Whether the last save had this digest and the file was not touched since."""
+        if self._last_saved is None or self._last_saved[0] != digest:
+            return False
+        try:
+            st = os.stat(self.config_file)
+        except OSError:
+            return False
+        return (st.st_mtime_ns, st.st_size) == self._last_saved[1:]
+
+    def _write_atomic(self, payload: bytes) -> None:
+        """
+        Writes the payload to a temp file in the target directory and
+        renames it over the config file, so readers never see a torn write.
+        """
+        directory = os.path.dirname(self.config_file) or '.'
+        tmp = tempfile.NamedTemporaryFile(
+            mode='wb',
+            dir=directory,
+            prefix=f".{os.path.basename(self.config_file)}.",
+            suffix='.tmp',
+            delete=False
+        )
+        try:
+            with tmp:
+                tmp.write(payload)
+                tmp.flush()
+                os.fsync(tmp.fileno())
+            os.replace(tmp.name, self.config_file)
+        except BaseException:
+            try:
+                os.remove(tmp.name)
+            except OSError:
+                pass
+            raise
+
+    def update_config(self, new_data: Dict[str, Any], autosave: Optional[bool] = None):
         """
         Updates the configuration with new data and saves it to file.
 
         Args:
             new_data: Dictionary with new data to update
+            autosave: Overrides self.autosave for this call. When the update
+                      is not saved, the loader is marked dirty until flush()
         """
-        self.config.update(new_data)
-        self.save_config()
+        self._apply_update(new_data)
+        if self.autosave if autosave is None else autosave:
+            self.save_config()
         if self.logger:
             self.logger.debug(f"Updated config with new data")
 
+    def _apply_update(self, new_data: Dict[str, Any]) -> None:
+        """
+        Merges new_data into the config and marks the loader dirty.
+
+        Equal values are not skipped: a value mutated in place and passed
+        back compares equal to itself, so only the digest check in
+        save_config can tell whether the file needs writing.
+        """
+        self.config.update(new_data)
+        self._dirty = True
+
+    def bulk_update(self, updates: Iterable[Dict[str, Any]]):
+        """
+        Applies several updates and writes the file at most once.
+
+        Args:
+            updates: Dictionaries applied in order, as with update_config
+        """
+        for new_data in updates:
+            self._apply_update(new_data)
+        if self.autosave:
+            self.flush()
+
+    def flush(self) -> bool:
+        """
+        Saves pending updates, if any.
+
+        Returns:
+            bool: True if the file was written
+        """
+        if not self._dirty:
+            return False
+        return self.save_config()
+
     def clear(self):
         """Clears the current configuration."""
         self.config = {}
+        self._dirty = False
         if self.logger:
             self.logger.debug("Cleared config")
 
     def delete_config_file(self):
         """Deletes the configuration file."""
-        if os.path.exists(self.config_file):
+        _invalidate_parse_cache(os.path.abspath(self.config_file))
+        self._last_saved = None
+        try:
             os.remove(self.config_file)
-            if self.logger:
-                self.logger.debug(f"Deleted config file {self.config_file}")
\ No newline at end of file
+        except FileNotFoundError:
+            return
+        if self.logger:
+            self.logger.debug(f"Deleted config file {self.config_file}")
\ No newline at end of file
@@ -21,6 +21,11 @@ def _setup_default_logger():
     return logger
 
 
+def _split_keys(keys_str: str) -> List[str]:
+    """Splits a comma-separated string into stripped, non-empty keys."""
+    return [k for k in map(str.strip, keys_str.split(",")) if k]
+
+
 def parse_keys(
         api_keys: Optional[Union[List[str], str]] = None,
         env_var: str = "API_KEYS",
@@ -68,10 +73,10 @@ def parse_keys(
     if api_keys is not None:
         if isinstance(api_keys, str):
             # Parsing comma-separated string
-            keys = [k.strip() for k in api_keys.split(",") if k.strip()]
+            keys = _split_keys(api_keys)
         elif isinstance(api_keys, list):
             # Cleaning list from empty strings and spaces
-            keys = [k.strip() for k in api_keys if k and k.strip()]
+            keys = [k for k in (k.strip() for k in api_keys if k) if k]
         else:
             logger.error("❌ API keys must be a list or comma-separated string.")
             raise NoAPIKeysError("❌ API keys must be a list or comma-separated string")
@@ -106,7 +111,7 @@ def parse_keys(
         raise NoAPIKeysError(error_msg)
 
     # Parsing keys from environment variable
-    keys = [k.strip() for k in keys_str.split(",") if k.strip()]
+    keys = _split_keys(keys_str)
 
     if not keys:
         error_msg = (
@@ -1,17 +1,21 @@
+import json
 import time
 import requests
 import asyncio
 import aiohttp
 import logging
 import random
+import functools
 import threading
-from typing import Any, List, Optional, Dict, Union, Callable, Tuple
+import itertools
+from email.utils import parsedate_to_datetime
+from types import MappingProxyType
+from typing import Any, List, Mapping, Optional, Dict, Union, Callable, Tuple
 from contextlib import asynccontextmanager
 from urllib.parse import urlparse
 
 from .key_parser import parse_keys
 from .exceptions import AllKeysExhaustedError
-from apikeyrotator.utils import async_retry_with_backoff
 from apikeyrotator.strategies import (
     RotationStrategy,
     create_rotation_strategy,
@@ -45,19 +49,54 @@ DEFAULT_AUTH_HEADERS = {
     'api_key': 'X-API-Key',
 }
 
+SENSITIVE_HEADERS = frozenset({'Authorization', 'X-API-Key'})
+
 KEY_LOG_LENGTH = 4
 KEY_LOG_SUFFIX = '****'
 
+# Domains whose filtered saved headers are memoized at once
+SAVED_HEADERS_MEMO_SIZE = 1024
+_NO_SAVED_HEADERS: Mapping[str, str] = MappingProxyType({})
+
+# Async connection pool, sized like the sync rotator's HTTPAdapter
+ASYNC_POOL_LIMIT = 100
+ASYNC_DNS_CACHE_TTL = 300
+
+# X-RateLimit-Reset values below this are seconds remaining, not an epoch
+RATE_LIMIT_RESET_EPOCH_MIN = 1e9
+
 
 class _ResponseCodeWrapper:
     """Wrapper for status code to simulate response object behavior for classifier"""
     __slots__ = ('status_code', 'headers')
 
-    def __init__(self, status_code: int, headers: Dict[str, str] = None):
+    def __init__(self, status_code: int, headers: Optional[Mapping[str, str]] = None):
         self.status_code = status_code
         self.headers = headers or {}
 
 
+class _CachedAsyncResponse:
+    """Minimal aiohttp-like response served from a middleware cache hit"""
+    __slots__ = ('status', 'headers', '_content')
+
+    def __init__(self, status: int, headers: Mapping[str, str], content: Any):
+        self.status = status
+        self.headers = headers
+        self._content = content if isinstance(content, bytes) else str(content).encode('utf-8')
+
+    async def json(self) -> Any:
+        return json.loads(self._content)
+
+    async def text(self) -> str:
+        return self._content.decode('utf-8')
+
+    async def read(self) -> bytes:
+        return self._content
+
+    def release(self) -> None:
+        pass
+
+
 def _setup_default_logger() -> logging.Logger:
     logger = logging.getLogger(__name__)
     if not logger.handlers:
@@ -71,74 +110,134 @@ def _setup_default_logger() -> logging.Logger:
     return logger
 
 
+def _active_hooks(
+        middlewares: Tuple[RotatorMiddleware, ...], name: str, delegate: Optional[str] = None
+) -> Tuple[Callable, ...]:
+    """
+    Collects the bound ``name`` hooks of middlewares that actually do work.
+
+    A hook still inherited from RotatorMiddleware is a pass-through and is
+    left out. The async defaults forward to their sync counterpart
+    (``delegate``), so they only count as no-ops if that one is inherited too.
+    """
+    hooks = []
+    for middleware in middlewares:
+        hook = getattr(middleware, name, None)
+        if hook is None:
+            continue
+        cls = type(middleware)
+        instance_attrs = getattr(middleware, '__dict__', {})
+        inherited = all(
+            getattr(cls, attr, None) is getattr(RotatorMiddleware, attr) and attr not in instance_attrs
+            for attr in ((name, delegate) if delegate else (name,))
+        )
+        if not inherited:
+            hooks.append(hook)
+    return tuple(hooks)
+
+
 # ============================================================================
 # THREAD-SAFE KEY MANAGER
 # ============================================================================
 
 class _ThreadSafeKeyManager:
-    """Simplified thread-safe key manager."""
+    """
+    Thread-safe key manager.
+
+    Keys and metrics are published as immutable snapshots (a tuple and a
+    read-only mapping) that are swapped wholesale under the lock whenever
+    the key set changes. Readers on the request hot path simply grab the
+    current reference, so picking a key takes no lock and copies nothing.
+    """
 
     def __init__(self, keys: List[str], logger: logging.Logger):
         self._lock = threading.RLock()
-        self._keys = keys.copy()
+        self._keys: Tuple[str, ...] = tuple(keys)
         self._key_metrics: Dict[str, KeyMetrics] = {
             key: KeyMetrics(key) for key in self._keys
         }
+        self._metrics_view: Mapping[str, KeyMetrics] = MappingProxyType(self._key_metrics)
         self.logger = logger
 
+    def _publish(self, keys: Tuple[str, ...], key_metrics: Dict[str, KeyMetrics]) -> None:
+        # Callers hold self._lock; the dict is never mutated after this point
+        self._keys = keys
+        self._key_metrics = key_metrics
+        self._metrics_view = MappingProxyType(key_metrics)
+
     def get_keys(self) -> List[str]:
-        with self._lock:
-            return self._keys.copy()
+        return list(self._keys)
+
+    def get_keys_snapshot(self) -> Tuple[str, ...]:
+        """Returns the current immutable key tuple without copying."""
+        return self._keys
 
     def get_key_count(self) -> int:
-        with self._lock:
-            return len(self._keys)
+        return len(self._keys)
 
     def remove_key(self, key: str) -> bool:
         with self._lock:
-            if key in self._keys:
-                self._keys.remove(key)
-                if key in self._key_metrics:
-                    del self._key_metrics[key]
-                return True
-            return False
+            # The metrics dict answers membership in O(1); the copies below
+            # are C-level slices/dict copies rather than Python-level scans
+            if key not in self._key_metrics:
+                return False
+            keys = self._keys
+            i = keys.index(key)
+            key_metrics = self._key_metrics.copy()
+            del key_metrics[key]
+            self._publish(keys[:i] + keys[i + 1:], key_metrics)
+            return True
 
     def get_metrics(self, key: Optional[str] = None) -> Dict[str, Dict]:
-        with self._lock:
-            if key:
-                if key in self._key_metrics:
-                    return {key: self._key_metrics[key].to_dict()}
-                return {}
-            return {k: v.to_dict() for k, v in self._key_metrics.items()}
+        key_metrics = self._metrics_view
+        if key:
+            if key in key_metrics:
+                return {key: key_metrics[key].to_dict()}
+            return {}
+        return {k: v.to_dict() for k, v in key_metrics.items()}
 
     def get_metric_objects(self) -> Dict[str, KeyMetrics]:
-        with self._lock:
-            return self._key_metrics.copy()
-
-    def update_metrics(self, key: str, success: bool, response_time: float, is_rate_limited: bool = False) -> None:
-        with self._lock:
-            if key in self._key_metrics:
-                self._key_metrics[key].update_from_request(
-                    success=success,
-                    response_time=response_time,
-                    is_rate_limited=is_rate_limited
-                )
+        return dict(self._metrics_view)
+
+    def get_metrics_view(self) -> Mapping[str, KeyMetrics]:
+        """Returns a read-only, zero-copy view of the current metrics."""
+        return self._metrics_view
+
+    # Per-key updates only touch one KeyMetrics, which carries its own
+    # lock, so they run in parallel across keys. self._lock is reserved
+    # for structural changes to the key set.
+    def update_metrics(
+            self, key: str, success: bool, response_time: float, is_rate_limited: bool = False,
+            rate_limit_reset: Optional[float] = None
+    ) -> None:
+        metrics = self._key_metrics.get(key)
+        if metrics is not None:
+            extra = {} if rate_limit_reset is None else {'rate_limit_reset': rate_limit_reset}
+            metrics.update_from_request(
+                success=success,
+                response_time=response_time,
+                is_rate_limited=is_rate_limited,
+                **extra
+            )
 
     def reset_health(self, key: Optional[str] = None) -> None:
-        with self._lock:
-            if key:
-                if key in self._key_metrics:
-                    self._key_metrics[key].is_healthy = True
-                    self._key_metrics[key].consecutive_failures = 0
-            else:
-                for metrics in self._key_metrics.values():
-                    metrics.is_healthy = True
-                    metrics.consecutive_failures = 0
+        key_metrics = self._key_metrics
+        if key:
+            targets = [key_metrics[key]] if key in key_metrics else []
+        else:
+            targets = list(key_metrics.values())
+        for metrics in targets:
+            metrics.reset_health()
 
     def reinit_keys(self, new_keys: List[str]) -> None:
+        """Replaces the key set, keeping learned metrics for keys that remain."""
         with self._lock:
-            self._keys = new_keys.copy()
-            self._key_metrics = {key: KeyMetrics(key) for key in self._keys}
+            keys = tuple(new_keys)
+            old_metrics = self._key_metrics
+            self._publish(keys, {
+                key: old_metrics[key] if key in old_metrics else KeyMetrics(key)
+                for key in keys
+            })
 
 
 # ============================================================================
@@ -169,6 +268,7 @@ class BaseKeyRotator:
             secret_provider: Optional[SecretProvider] = None,
             enable_metrics: bool = True,
             save_sensitive_headers: bool = False,
+            max_backoff: float = 60.0,
     ):
         self.logger = logger if logger else _setup_default_logger()
 
@@ -182,23 +282,37 @@ class BaseKeyRotator:
             raise ValueError("At least one API key is required")
 
         self.key_manager = _ThreadSafeKeyManager(keys, self.logger)
+        self._auth_headers: Dict[str, Tuple[str, str]] = {}
+        self._build_auth_headers(keys)
+        # Masked key prefixes for log messages, filled on first use
+        self._key_labels: Dict[str, str] = {}
 
         self.max_retries = max_retries
         self.base_delay = base_delay
+        self.max_backoff = max_backoff
         self.timeout = timeout
         self.should_retry_callback = should_retry_callback
         self.header_callback = header_callback
+        self._header_cb_shape: Optional[type] = None
         self.config_file = config_file
         self.save_sensitive_headers = save_sensitive_headers
         self.error_classifier = error_classifier or ErrorClassifier()
         self.random_delay_range = random_delay_range
+        self._last_sent: Dict[str, float] = {}
+        # If base_delay/max_backoff are reassigned later, delays are computed directly
+        self._backoff_params = (base_delay, max_backoff)
+        self._backoff_schedule = tuple(
+            min(base_delay * (2 ** i), max_backoff) for i in range(max(max_retries, 0))
+        )
         self.user_agents = user_agents or []
-        self._ua_index = 0
+        self._ua_counter = itertools.count()
         self.proxy_list = proxy_list or []
-        self._proxy_index = 0
+        self._proxy_counter = itertools.count()
 
         self.config_loader = config_loader or ConfigLoader(config_file=config_file, logger=self.logger)
         self.config = self.config_loader.load_config()
+        # domain -> (config's saved headers dict, filtered copy)
+        self._saved_headers: Dict[str, Tuple[Mapping[str, str], Dict[str, str]]] = {}
 
         self.rotation_strategy_kwargs = rotation_strategy_kwargs or {}
         self._init_rotation_strategy(rotation_strategy)
@@ -215,7 +329,7 @@ class BaseKeyRotator:
         else:
             self.rotation_strategy = create_rotation_strategy(
                 rotation_strategy,
-                self.key_manager.get_keys(),
+                self.key_manager.get_keys_snapshot(),
                 **self.rotation_strategy_kwargs
             )
 
@@ -228,6 +342,30 @@ class BaseKeyRotator:
         if self.middlewares:
             self.logger.info(f"✅ Middlewares loaded: {len(self.middlewares)}")
 
+    @property
+    def middlewares(self) -> Tuple[RotatorMiddleware, ...]:
+        return self._middlewares
+
+    @middlewares.setter
+    def middlewares(self, middlewares: List[RotatorMiddleware]):
+        """
+        Sets the middleware chain and resolves its hooks once.
+
+        Hooks are looked up here rather than per request, so the chain is
+        stored as a tuple: assign a new list or use add_middleware() instead
+        of mutating it in place.
+        """
+        middlewares = tuple(middlewares)
+        self._middlewares = middlewares
+        self._before_hooks_sync = _active_hooks(middlewares, 'before_request_sync')
+        self._after_hooks_sync = _active_hooks(middlewares, 'after_request_sync')
+        self._before_hooks_async = _active_hooks(middlewares, 'before_request', 'before_request_sync')
+        self._after_hooks_async = _active_hooks(middlewares, 'after_request', 'after_request_sync')
+
+    def add_middleware(self, middleware: RotatorMiddleware) -> None:
+        """Appends a middleware to the chain and re-resolves the hooks."""
+        self.middlewares = self._middlewares + (middleware,)
+
     @property
     def keys(self) -> List[str]:
         return self.key_manager.get_keys()
@@ -235,6 +373,8 @@ class BaseKeyRotator:
     @keys.setter
     def keys(self, new_keys: List[str]):
         self.key_manager.reinit_keys(new_keys)
+        self._build_auth_headers(new_keys)
+        self._key_labels = {}
         if hasattr(self.rotation_strategy, 'update_keys'):
             self.rotation_strategy.update_keys(new_keys)
 
@@ -252,6 +392,7 @@ class BaseKeyRotator:
         self.key_manager.reset_health(key)
 
     @staticmethod
+    @functools.lru_cache(maxsize=1024)
     def _get_domain_from_url(url: str) -> str:
         try:
             return urlparse(url).netloc
@@ -266,76 +407,221 @@ class BaseKeyRotator:
             return DEFAULT_AUTH_HEADERS['api_key'], key
         return DEFAULT_AUTH_HEADERS['bearer'], f"Key {key}"
 
+    def _build_auth_headers(self, keys: List[str]) -> None:
+        """Precomputes the auth header for every key; a key's scheme never changes."""
+        old_headers = self._auth_headers
+        self._auth_headers = {
+            key: old_headers[key] if key in old_headers else self._infer_auth_header(key)
+            for key in keys
+        }
+
+    def _get_auth_header(self, key: str) -> Tuple[str, str]:
+        auth_header = self._auth_headers.get(key)
+        if auth_header is None:
+            auth_header = self._auth_headers[key] = self._infer_auth_header(key)
+        return auth_header
+
+    def _key_label(self, key: str) -> str:
+        """Masked form of a key for logging, built once per key."""
+        label = self._key_labels.get(key)
+        if label is None:
+            label = self._key_labels[key] = f"{key[:KEY_LOG_LENGTH]}{KEY_LOG_SUFFIX}"
+        return label
+
+    def _remove_invalid_key(self, key: str) -> None:
+        """Drops a permanently invalid key from the manager, strategy and caches."""
+        self.key_manager.remove_key(key)
+        self._auth_headers.pop(key, None)
+        self._key_labels.pop(key, None)
+        self._last_sent.pop(key, None)
+        if hasattr(self.rotation_strategy, 'remove_key'):
+            self.rotation_strategy.remove_key(key)
+        elif hasattr(self.rotation_strategy, 'update_keys'):
+            self.rotation_strategy.update_keys(self.key_manager.get_keys_snapshot())
+
     def get_next_key(self) -> str:
-        keys = self.key_manager.get_keys()
-        if not keys:
+        if not self.key_manager.get_key_count():
             raise AllKeysExhaustedError("No valid keys available")
 
-        metrics_objects = self.key_manager.get_metric_objects()
-        key = self.rotation_strategy.get_next_key(metrics_objects)
+        key = self.rotation_strategy.get_next_key(self.key_manager.get_metrics_view())
 
-        self.logger.debug(f"Selected key: {key[:KEY_LOG_LENGTH]}{KEY_LOG_SUFFIX}")
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug("Selected key: %s", self._key_label(key))
         return key
 
+    # next() on itertools.count is atomic under the GIL, so the cursors
+    # below advance correctly across threads without a Python-level lock.
     def get_next_user_agent(self) -> Optional[str]:
-        if not self.user_agents:
+        user_agents = self.user_agents
+        if not user_agents:
             return None
-        ua = self.user_agents[self._ua_index]
-        self._ua_index = (self._ua_index + 1) % len(self.user_agents)
-        return ua
+        return user_agents[next(self._ua_counter) % len(user_agents)]
 
     def get_next_proxy(self) -> Optional[str]:
-        if not self.proxy_list:
+        proxy_list = self.proxy_list
+        if not proxy_list:
             return None
-        proxy = self.proxy_list[self._proxy_index]
-        self._proxy_index = (self._proxy_index + 1) % len(self.proxy_list)
-        return proxy
+        return proxy_list[next(self._proxy_counter) % len(proxy_list)]
+
+    def _get_saved_headers(self, domain: str) -> Dict[str, str]:
+        """
+        Returns the filtered saved headers for a domain. The filtered copy is
+        reused while the config still holds the same saved dict, so a config
+        update replacing it is picked up on the next request.
+        """
+        saved = self.config.get("successful_headers", {}).get(domain, _NO_SAVED_HEADERS)
+        memo = self._saved_headers.get(domain)
+        if memo is not None and memo[0] is saved:
+            return memo[1]
+        # Racing threads compute the same value, so no lock is needed
+        safe_headers = {k: v for k, v in saved.items() if k not in SENSITIVE_HEADERS}
+        if len(self._saved_headers) >= SAVED_HEADERS_MEMO_SIZE:
+            self._saved_headers.clear()
+        self._saved_headers[domain] = (saved, safe_headers)
+        return safe_headers
 
     def _prepare_headers_and_cookies(
-            self, key: str, custom_headers: Optional[Dict[str, str]], url: str
+            self, key: str, custom_headers: Optional[Dict[str, str]], url: str,
+            domain: Optional[str] = None
     ) -> Tuple[Dict[str, str], Dict[str, str]]:
         headers = custom_headers.copy() if custom_headers else {}
         cookies = {}
-        domain = self._get_domain_from_url(url)
+        if domain is None:
+            domain = self._get_domain_from_url(url)
 
         if self.save_sensitive_headers and domain:
-            saved = self.config.get("successful_headers", {}).get(domain, {})
-            safe_headers = {k: v for k, v in saved.items() if k not in ["Authorization", "X-API-Key"]}
-            headers.update(safe_headers)
+            headers.update(self._get_saved_headers(domain))
 
         if self.header_callback:
             result = self.header_callback(key, custom_headers)
-            if isinstance(result, tuple) and len(result) == 2:
+            # A callback returns the same shape every time; once seen, an
+            # exact type match skips the isinstance probing below
+            if type(result) is self._header_cb_shape:
+                if self._header_cb_shape is dict:
+                    headers.update(result)
+                elif len(result) == 2:
+                    headers.update(result[0])
+                    cookies.update(result[1])
+            elif isinstance(result, tuple) and len(result) == 2:
                 headers.update(result[0])
                 cookies.update(result[1])
+                self._header_cb_shape = tuple if type(result) is tuple else None
             elif isinstance(result, dict):
                 headers.update(result)
+                self._header_cb_shape = dict if type(result) is dict else None
+
+        # HTTP header names are case-insensitive; lower them once and
+        # answer both presence checks from the same set
+        present = {name.lower() for name in headers} if headers else ()
 
-        if "Authorization" not in headers:
-            header_name, header_value = self._infer_auth_header(key)
+        if "authorization" not in present:
+            header_name, header_value = self._get_auth_header(key)
             headers[header_name] = header_value
 
         user_agent = self.get_next_user_agent()
-        if user_agent and "User-Agent" not in headers:
+        if user_agent and "user-agent" not in present:
             headers["User-Agent"] = user_agent
 
         return headers, cookies
 
-    def _apply_random_delay(self) -> None:
+    # random.random() is a C call; random.uniform() wraps it in Python,
+    # so the jitter below is written out as lo + span * random().
+    def _random_delay(self) -> float:
+        low, high = self.random_delay_range
+        delay = low + (high - low) * random.random()
+        return delay * (1.0 + 0.1 * random.random())
+
+    def _pacing_delay(self, key: str) -> float:
+        """
+        The random delay is the gap between two sends on the same key, so
+        time already spent since the key's last send (other keys' requests,
+        the caller's own work) is subtracted instead of slept again.
+        """
+        delay = self._random_delay()
+        last_sent = self._last_sent.get(key)
+        if last_sent is not None:
+            delay -= time.monotonic() - last_sent
+        return delay
+
+    def _apply_random_delay(self, key: str) -> None:
         if not self.random_delay_range:
             return
-        delay = random.uniform(self.random_delay_range[0], self.random_delay_range[1])
-        time.sleep(delay + random.uniform(0, delay * 0.1))
+        delay = self._pacing_delay(key)
+        if delay > 0:
+            time.sleep(delay)
+        self._last_sent[key] = time.monotonic()
 
-    async def _apply_random_delay_async(self) -> None:
+    async def _apply_random_delay_async(self, key: str) -> None:
         if not self.random_delay_range:
             return
-        delay = random.uniform(self.random_delay_range[0], self.random_delay_range[1])
-        await asyncio.sleep(delay + random.uniform(0, delay * 0.1))
+        delay = self._pacing_delay(key)
+        if delay > 0:
+            await asyncio.sleep(delay)
+        self._last_sent[key] = time.monotonic()
+
+    @staticmethod
+    def _rate_limit_reset(headers: Optional[Mapping[str, str]]) -> Optional[float]:
+        """Wall-clock time a rate-limited key may be used again, if the server said."""
+        if not headers:
+            return None
+        retry_after = headers.get('Retry-After')
+        if retry_after:
+            try:
+                return time.time() + float(retry_after)
+            except ValueError:
+                try:
+                    return parsedate_to_datetime(retry_after).timestamp()
+                except (TypeError, ValueError):
+                    pass
+        reset = headers.get('X-RateLimit-Reset')
+        if reset:
+            try:
+                value = float(reset)
+            except ValueError:
+                return None
+            return value if value >= RATE_LIMIT_RESET_EPOCH_MIN else time.time() + value
+        return None
+
+    def _rate_limit_delay(self, rate_limit_reset: Optional[float], attempt: int) -> float:
+        """
+        Delay before retrying after a 429. With a known reset the limited key
+        is skipped by the strategy, so the retry goes out at once while any
+        key is usable; once all keys wait on a reset, it waits for the
+        soonest one instead of sending requests bound to be rejected.
+
+        Raises:
+            AllKeysExhaustedError: If the soonest reset is beyond max_backoff
+        """
+        now = time.time()
+        # A reset already in the past leaves the key selectable, so only
+        # backoff keeps the retry from hitting it again straight away
+        if rate_limit_reset is None or rate_limit_reset <= now:
+            return self._calculate_backoff_delay(attempt)
+
+        soonest = None
+        for metrics in self.key_manager.get_metrics_view().values():
+            reset = metrics.rate_limit_reset
+            if reset <= now:
+                if metrics.is_healthy:
+                    return 0.0
+            elif soonest is None or reset < soonest:
+                soonest = reset
+
+        if soonest is None:
+            return self._calculate_backoff_delay(attempt)
+        wait = soonest - now
+        if wait > self.max_backoff:
+            raise AllKeysExhaustedError(f"All keys rate limited for another {wait:.0f}s")
+        return wait
 
     def _calculate_backoff_delay(self, attempt: int) -> float:
-        delay = self.base_delay * (2 ** attempt)
-        return delay + random.uniform(0, delay * 0.1)
+        # The cap applies before jitter so capped retries still spread out
+        schedule = self._backoff_schedule
+        if 0 <= attempt < len(schedule) and self._backoff_params == (self.base_delay, self.max_backoff):
+            delay = schedule[attempt]
+        else:
+            delay = min(self.base_delay * (2 ** attempt), self.max_backoff)
+        return delay * (1.0 + 0.1 * random.random())
 
     @property
     def key_count(self) -> int:
@@ -377,10 +663,18 @@ class APIKeyRotator(BaseKeyRotator):
         if not url or not url.strip():
             raise ValueError("URL cannot be empty")
 
-        self.logger.info(f"Initiating {method} request to {url}")
+        # Normalized once so middleware can compare it without re-casing
+        method = method.upper()
+        self.logger.info("Initiating %s request to %s", method, url)
         domain = self._get_domain_from_url(url)
         start_time = time.time()
 
+        # Per-call settings that do not change between attempts
+        custom_headers = kwargs.get("headers")
+        timeout = kwargs.get("timeout", self.timeout)
+        last_proxy = None
+        proxies = None
+
         retry_attempt = 0
 
         while True:
@@ -396,78 +690,96 @@ class APIKeyRotator(BaseKeyRotator):
             except AllKeysExhaustedError:
                 raise
 
-            headers, cookies = self._prepare_headers_and_cookies(key, kwargs.get("headers"), url)
+            headers, cookies = self._prepare_headers_and_cookies(key, custom_headers, url, domain)
             request_kwargs = kwargs.copy()
             request_kwargs["headers"] = headers
             request_kwargs["cookies"] = cookies
-            request_kwargs["timeout"] = kwargs.get("timeout", self.timeout)
+            request_kwargs["timeout"] = timeout
 
             proxy = self.get_next_proxy()
             if proxy:
-                request_kwargs["proxies"] = {"http": proxy, "https": proxy}
-
-            self._apply_random_delay()
-
-            request_info = RequestInfo(
-                method=method, url=url, headers=headers, cookies=cookies,
-                key=key, attempt=retry_attempt, kwargs=request_kwargs
-            )
+                if proxy != last_proxy:
+                    last_proxy = proxy
+                    proxies = {"http": proxy, "https": proxy}
+                request_kwargs["proxies"] = proxies
+
+            # Middleware views of the request/response are only built when
+            # some hook is registered to look at them
+            before_hooks = self._before_hooks_sync
+            after_hooks = self._after_hooks_sync
+            request_info = None
+            if before_hooks or after_hooks:
+                request_info = RequestInfo(
+                    method=method, url=url, headers=headers, cookies=cookies,
+                    key=key, attempt=retry_attempt, kwargs=request_kwargs
+                )
 
-            for middleware in self.middlewares:
-                if hasattr(middleware, 'before_request_sync'):
-                    result = middleware.before_request_sync(request_info)
+                for before_request in before_hooks:
+                    result = before_request(request_info)
                     if isinstance(result, ResponseInfo):
                         response = requests.Response()
                         response.status_code = result.status_code
                         response._content = result.content
-                        if isinstance(result.headers, dict):
+                        if result.headers:
                             response.headers.update(result.headers)
                         return response
                     request_info = result
                     request_kwargs["headers"] = request_info.headers
                     request_kwargs["cookies"] = request_info.cookies
 
+            # Delay only requests that actually go out; cache hits return above
+            self._apply_random_delay(key)
+
             try:
+                # Session.request is used rather than prepare_request()/send():
+                # the auth header changes on every attempt, so the request
+                # must be re-prepared anyway, and request() is also what
+                # merges the environment's proxies/verify/cert settings.
                 response = self.session.request(method, url, **request_kwargs)
                 request_time = time.time() - start_time
 
-                response_info = ResponseInfo(
-                    status_code=response.status_code, headers=dict(response.headers),
-                    content=response.content, request_info=request_info
-                )
-                for middleware in self.middlewares:
-                    if hasattr(middleware, 'after_request_sync'):
-                        response_info = middleware.after_request_sync(response_info)
+                if after_hooks:
+                    # Headers are passed through as the case-insensitive
+                    # mapping the client returned, not copied into a dict
+                    response_info = ResponseInfo(
+                        status_code=response.status_code, headers=response.headers,
+                        content=response.content, request_info=request_info
+                    )
+                    for after_request in after_hooks:
+                        response_info = after_request(response_info)
 
                 error_type = self.error_classifier.classify_error(response=response)
 
                 is_success = error_type not in [ErrorType.RATE_LIMIT, ErrorType.TEMPORARY, ErrorType.PERMANENT]
                 is_rate_limited = (error_type == ErrorType.RATE_LIMIT)
+                rate_limit_reset = self._rate_limit_reset(response.headers) if is_rate_limited else None
 
                 if self.metrics:
                     self.metrics.record_request(
                         key=key, endpoint=url, success=is_success,
                         response_time=request_time, is_rate_limited=is_rate_limited
                     )
-                self.key_manager.update_metrics(key, is_success, request_time, is_rate_limited)
+                self.key_manager.update_metrics(key, is_success, request_time, is_rate_limited, rate_limit_reset)
 
                 if error_type == ErrorType.PERMANENT:
                     self.logger.error(
-                        f"❌ Key {key[:KEY_LOG_LENGTH]}{KEY_LOG_SUFFIX} permanently invalid (Status: {response.status_code})")
-                    self.key_manager.remove_key(key)
-                    if hasattr(self.rotation_strategy, 'update_keys'):
-                        self.rotation_strategy.update_keys(self.key_manager.get_keys())
+                        "❌ Key %s permanently invalid (Status: %s)", self._key_label(key), response.status_code)
+                    self._remove_invalid_key(key)
                     continue
 
                 elif error_type in [ErrorType.RATE_LIMIT, ErrorType.TEMPORARY]:
                     retry_attempt += 1
                     msg = "Rate limited" if error_type == ErrorType.RATE_LIMIT else "Temporary error"
                     self.logger.warning(
-                        f"↻ {msg} (Status: {response.status_code}). Attempt {retry_attempt}/{self.max_retries}")
+                        "↻ %s (Status: %s). Attempt %s/%s", msg, response.status_code, retry_attempt, self.max_retries)
 
                     if retry_attempt < self.max_retries:
-                        delay = self._calculate_backoff_delay(retry_attempt - 1)
-                        time.sleep(delay)
+                        if is_rate_limited:
+                            delay = self._rate_limit_delay(rate_limit_reset, retry_attempt - 1)
+                        else:
+                            delay = self._calculate_backoff_delay(retry_attempt - 1)
+                        if delay > 0:
+                            time.sleep(delay)
                         continue
                     continue
 
@@ -476,14 +788,14 @@ class APIKeyRotator(BaseKeyRotator):
                     time.sleep(self._calculate_backoff_delay(retry_attempt - 1))
                     continue
 
-                self.logger.info(f"✅ Success (Status: {response.status_code})")
+                self.logger.info("✅ Success (Status: %s)", response.status_code)
                 return response
 
             except requests.RequestException as e:
                 request_time = time.time() - start_time
                 self.key_manager.update_metrics(key, False, request_time)
                 retry_attempt += 1
-                self.logger.error(f"⚠️ Network error: {e}. Attempt {retry_attempt}/{self.max_retries}")
+                self.logger.error("⚠️ Network error: %s. Attempt %s/%s", e, retry_attempt, self.max_retries)
                 if retry_attempt < self.max_retries:
                     time.sleep(self._calculate_backoff_delay(retry_attempt - 1))
                     continue
@@ -509,6 +821,7 @@ class AsyncAPIKeyRotator(BaseKeyRotator):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self._session: Optional[aiohttp.ClientSession] = None
+        self._session_loop: Optional[asyncio.AbstractEventLoop] = None
         self.logger.info("✅ Async rotator initialized")
 
     async def __aenter__(self):
@@ -520,18 +833,58 @@ class AsyncAPIKeyRotator(BaseKeyRotator):
             await self._session.close()
 
     async def _get_session(self) -> aiohttp.ClientSession:
-        if self._session is None or self._session.closed:
-            self._session = aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=self.timeout))
+        # A session is bound to the loop it was created on, so a rotator
+        # reused from another loop (tests, fresh workers) gets a new one
+        loop = asyncio.get_running_loop()
+        if self._session is None or self._session.closed or self._session_loop is not loop:
+            self._discard_session()
+            connector = aiohttp.TCPConnector(
+                limit=ASYNC_POOL_LIMIT,
+                ttl_dns_cache=ASYNC_DNS_CACHE_TTL,
+                enable_cleanup_closed=True
+            )
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(total=self.timeout)
+            )
+            self._session_loop = loop
         return self._session
 
+    def _discard_session(self) -> None:
+        """
+        Closes a session left on another event loop. It cannot be awaited
+        from here, so it is detached and its connector closed directly, on
+        its own loop if that loop is still running.
+        """
+        session, old_loop = self._session, self._session_loop
+        self._session = None
+        if session is None or session.closed:
+            return
+        connector = session.connector
+        session.detach()
+        if connector is None:
+            return
+        if old_loop is not None and old_loop.is_running():
+            old_loop.call_soon_threadsafe(connector._close)
+        else:
+            connector._close()
+
     async def request(self, method: str, url: str, **kwargs) -> aiohttp.ClientResponse:
         if not url or not url.strip():
             raise ValueError("URL cannot be empty")
 
-        self.logger.info(f"Initiating async {method} request to {url}")
+        # Normalized once so middleware can compare it without re-casing
+        method = method.upper()
+        self.logger.info("Initiating async %s request to %s", method, url)
         session = await self._get_session()
         domain = self._get_domain_from_url(url)
 
+        # Take the per-attempt fields out of kwargs once (it is this call's
+        # own dict), so attempts pass them as keywords instead of copying it
+        custom_headers = kwargs.pop("headers", None)
+        kwargs.pop("cookies", None)  # always replaced by the rotator's cookies
+        default_proxy = kwargs.pop("proxy", None)
+
         retry_attempt = 0
 
         while True:
@@ -542,80 +895,79 @@ class AsyncAPIKeyRotator(BaseKeyRotator):
                 raise AllKeysExhaustedError("All keys are invalid")
 
             key = self.get_next_key()
-            headers, cookies = self._prepare_headers_and_cookies(key, kwargs.get("headers"), url)
-
-            request_kwargs = kwargs.copy()
-            request_kwargs["headers"] = headers
-            request_kwargs["cookies"] = cookies
-
-            proxy = self.get_next_proxy()
-            if proxy:
-                request_kwargs["proxy"] = proxy
-
-            await self._apply_random_delay_async()
-
-            request_info = RequestInfo(
-                method=method, url=url, headers=headers, cookies=cookies,
-                key=key, attempt=retry_attempt, kwargs=request_kwargs
-            )
+            headers, cookies = self._prepare_headers_and_cookies(key, custom_headers, url, domain)
+            proxy = self.get_next_proxy() or default_proxy
+
+            before_hooks = self._before_hooks_async
+            after_hooks = self._after_hooks_async
+            request_info = None
+            request_kwargs = None
+            if before_hooks or after_hooks:
+                # Middleware may inspect and mutate the kwargs, so it gets a
+                # full per-attempt dict
+                request_kwargs = dict(kwargs, headers=headers, cookies=cookies)
+                if proxy:
+                    request_kwargs["proxy"] = proxy
+                request_info = RequestInfo(
+                    method=method, url=url, headers=headers, cookies=cookies,
+                    key=key, attempt=retry_attempt, kwargs=request_kwargs
+                )
 
-            for middleware in self.middlewares:
-                if hasattr(middleware, 'before_request'):
-                    result = await middleware.before_request(request_info)
+                for before_request in before_hooks:
+                    result = await before_request(request_info)
                     if isinstance(result, ResponseInfo):
-                        class CachedAsyncResponse:
-                            def __init__(self, status, headers, content):
-                                self.status = status
-                                self.headers = headers
-                                self._content = content if isinstance(content, bytes) else str(content).encode('utf-8')
-                            async def json(self):
-                                import json
-                                return json.loads(self._content)
-                            async def text(self):
-                                return self._content.decode('utf-8')
-                            async def read(self):
-                                return self._content
-                            def release(self): pass
-                        return CachedAsyncResponse(result.status_code, result.headers, result.content)
+                        return _CachedAsyncResponse(result.status_code, result.headers, result.content)
                     request_info = result
                     request_kwargs["headers"] = request_info.headers
                     request_kwargs["cookies"] = request_info.cookies
 
+            # Delay only requests that actually go out; cache hits return above
+            await self._apply_random_delay_async(key)
+
             start_time = time.time()
             try:
-                response = await session.request(method, url, **request_kwargs)
+                if request_kwargs is None:
+                    response = await session.request(
+                        method, url, headers=headers, cookies=cookies, proxy=proxy, **kwargs
+                    )
+                else:
+                    response = await session.request(method, url, **request_kwargs)
                 request_time = time.time() - start_time
 
-                response_info = ResponseInfo(
-                    status_code=response.status,
-                    headers=dict(response.headers),
-                    content=None,
-                    request_info=request_info
-                )
+                if after_hooks:
+                    # read() buffers the body on the response, so the caller
+                    # can still read it; middleware (e.g. caching) needs the
+                    # bytes to be able to serve a later hit
+                    response_info = ResponseInfo(
+                        status_code=response.status,
+                        headers=response.headers,
+                        content=await response.read(),
+                        request_info=request_info
+                    )
 
-                for middleware in self.middlewares:
-                    response_info = await middleware.after_request(response_info)
+                    for after_request in after_hooks:
+                        response_info = await after_request(response_info)
 
+                # aiohttp headers are already a case-insensitive mapping
                 error_type = self.error_classifier.classify_error(
-                    response=_ResponseCodeWrapper(response.status, dict(response.headers))
+                    response=_ResponseCodeWrapper(response.status, response.headers)
                 )
 
                 is_success = error_type not in [ErrorType.RATE_LIMIT, ErrorType.TEMPORARY, ErrorType.PERMANENT]
                 is_rate_limited = (error_type == ErrorType.RATE_LIMIT)
+                rate_limit_reset = self._rate_limit_reset(response.headers) if is_rate_limited else None
 
                 if self.metrics:
                     self.metrics.record_request(
                         key=key, endpoint=url, success=is_success,
                         response_time=request_time, is_rate_limited=is_rate_limited
                     )
-                self.key_manager.update_metrics(key, is_success, request_time, is_rate_limited)
+                self.key_manager.update_metrics(key, is_success, request_time, is_rate_limited, rate_limit_reset)
 
                 if error_type == ErrorType.PERMANENT:
                     self.logger.error(
-                        f"❌ Key {key[:KEY_LOG_LENGTH]}{KEY_LOG_SUFFIX} permanently invalid (Status: {response.status})")
-                    self.key_manager.remove_key(key)
-                    if hasattr(self.rotation_strategy, 'update_keys'):
-                        self.rotation_strategy.update_keys(self.key_manager.get_keys())
+                        "❌ Key %s permanently invalid (Status: %s)", self._key_label(key), response.status)
+                    self._remove_invalid_key(key)
                     response.release()
                     continue
 
@@ -623,9 +975,13 @@ class AsyncAPIKeyRotator(BaseKeyRotator):
                     retry_attempt += 1
                     response.release()
                     if retry_attempt < self.max_retries:
-                        delay = self._calculate_backoff_delay(retry_attempt - 1)
-                        self.logger.warning(f"↻ Temporary error/RateLimit. Waiting {delay:.2f}s")
-                        await asyncio.sleep(delay)
+                        if is_rate_limited:
+                            delay = self._rate_limit_delay(rate_limit_reset, retry_attempt - 1)
+                        else:
+                            delay = self._calculate_backoff_delay(retry_attempt - 1)
+                        self.logger.warning("↻ Temporary error/RateLimit. Waiting %.2fs", delay)
+                        if delay > 0:
+                            await asyncio.sleep(delay)
                         continue
                     continue
 
@@ -635,14 +991,14 @@ class AsyncAPIKeyRotator(BaseKeyRotator):
                     await asyncio.sleep(self._calculate_backoff_delay(retry_attempt - 1))
                     continue
 
-                self.logger.info(f"✅ Success (Status: {response.status})")
+                self.logger.info("✅ Success (Status: %s)", response.status)
                 return response
 
             except (aiohttp.ClientError, asyncio.TimeoutError) as e:
                 request_time = time.time() - start_time
                 self.key_manager.update_metrics(key, False, request_time)
                 retry_attempt += 1
-                self.logger.error(f"⚠️ Async Network error: {e}")
+                self.logger.error("⚠️ Async Network error: %s", e)
                 if retry_attempt < self.max_retries:
                     await asyncio.sleep(self._calculate_backoff_delay(retry_attempt - 1))
                     continue
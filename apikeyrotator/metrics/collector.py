@@ -5,7 +5,7 @@ Metrics collector for the rotator
 import time
 import threading
 from collections import defaultdict
-from typing import Dict, Any
+from typing import Dict, Any, List, Tuple
 
 from .models import EndpointStats
 
@@ -19,22 +19,61 @@ class RotatorMetrics:
     - Uptime
 
     Note: Key metrics are now stored in BaseKeyRotator._key_metrics
+
+    The request totals are counted in per-thread shards that only their
+    owning thread writes to, so recording a request takes no lock; the
+    totals are summed from the shards when read.
     """
 
     def __init__(self):
         # Statistics by endpoint
         self.endpoint_stats: Dict[str, EndpointStats] = defaultdict(EndpointStats)
 
-        # General statistics
-        self.total_requests = 0
-        self.successful_requests = 0
-        self.failed_requests = 0
+        # General statistics: [total, successful, failed] per thread
+        # Counts folded from finished threads and the live shards are
+        # swapped together as one tuple so readers never see them torn
+        self._local = threading.local()
+        self._shard_state: Tuple[List[int], List[Tuple[threading.Thread, List[int]]]] = ([0, 0, 0], [])
         self.start_time = time.time()
 
         # Thread-safety
         self._lock = threading.RLock()
         self._endpoint_lock = threading.RLock()
 
+    def _get_shard(self) -> List[int]:
+        shard = getattr(self._local, 'shard', None)
+        if shard is None:
+            shard = [0, 0, 0]
+            with self._lock:
+                # Fold shards of finished threads so the list stays bounded
+                retired, shards = self._shard_state
+                live = []
+                for thread, counts in shards:
+                    if thread.is_alive():
+                        live.append((thread, counts))
+                    else:
+                        retired = [a + b for a, b in zip(retired, counts)]
+                live.append((threading.current_thread(), shard))
+                self._shard_state = (retired, live)
+            self._local.shard = shard
+        return shard
+
+    def _sum_shards(self, index: int) -> int:
+        retired, shards = self._shard_state
+        return retired[index] + sum(counts[index] for _, counts in shards)
+
+    @property
+    def total_requests(self) -> int:
+        return self._sum_shards(0)
+
+    @property
+    def successful_requests(self) -> int:
+        return self._sum_shards(1)
+
+    @property
+    def failed_requests(self) -> int:
+        return self._sum_shards(2)
+
     def record_request(
             self,
             key: str,
@@ -53,13 +92,13 @@ class RotatorMetrics:
             response_time: Execution time in seconds
             is_rate_limited: Whether rate limit was hit
         """
-        # General statistics (thread-safe)
-        with self._lock:
-            self.total_requests += 1
-            if success:
-                self.successful_requests += 1
-            else:
-                self.failed_requests += 1
+        # General statistics (thread-local, no lock)
+        shard = self._get_shard()
+        shard[0] += 1
+        if success:
+            shard[1] += 1
+        else:
+            shard[2] += 1
 
         # Endpoint statistics (separate lock to minimize contention)
         with self._endpoint_lock:
@@ -73,14 +112,13 @@ class RotatorMetrics:
         """
         with self._lock, self._endpoint_lock:
             uptime = time.time() - self.start_time
+            total = self.total_requests
+            successful = self.successful_requests
             return {
-                "total_requests": self.total_requests,
-                "successful_requests": self.successful_requests,
+                "total_requests": total,
+                "successful_requests": successful,
                 "failed_requests": self.failed_requests,
-                "success_rate": (
-                    self.successful_requests / self.total_requests
-                    if self.total_requests > 0 else 0.0
-                ),
+                "success_rate": successful / total if total > 0 else 0.0,
                 "uptime_seconds": uptime,
                 "endpoint_stats": {
                     k: v.to_dict() for k, v in self.endpoint_stats.items()
@@ -119,7 +157,7 @@ class RotatorMetrics:
         """Resets all metrics"""
         with self._lock, self._endpoint_lock:
             self.endpoint_stats.clear()
-            self.total_requests = 0
-            self.successful_requests = 0
-            self.failed_requests = 0
+            # Threads re-register a fresh shard on their next request
+            self._local = threading.local()
+            self._shard_state = ([0, 0, 0], [])
             self.start_time = time.time()
@@ -5,17 +5,79 @@ import time
 import hashlib
 import json
 import logging
+import re
 import threading
-from typing import Dict, Any, Optional, Union
-from collections import OrderedDict
+from contextlib import nullcontext
+from typing import Deque, Dict, Any, List, Optional, Tuple, Union
+from collections import deque
 from .base import RotatorMiddleware
 from .models import RequestInfo, ResponseInfo, ErrorInfo
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Streaming responses that must never be replayed from cache
+_UNCACHEABLE_CONTENT_TYPE_RE = re.compile(
+    r'text/event-stream|multipart/x-mixed-replace', re.IGNORECASE
+)
+_UNCACHEABLE_CACHE_CONTROL_RE = re.compile(r'no-store|private', re.IGNORECASE)
+
+# Request headers (lower-case) that do not select a different response:
+# credentials, per-request rotation values and transport details. Host
+# stays in the key, since a Host override can address another virtual host.
+_EXCLUDED_KEY_HEADERS = frozenset({
+    'authorization', 'x-api-key', 'user-agent', 'cookie',
+    'accept-encoding', 'connection',
+})
+
+# Upper bound on memoized URL -> GET cache key entries before the memo resets
+_URL_KEY_MEMO_SIZE = 1024
+
+if orjson is not None:
+    def _dumps_sorted(body: Any) -> bytes:
+        return orjson.dumps(body, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS)
+else:
+    # Built once: json.dumps() with non-default options constructs a new
+    # JSONEncoder on every call
+    _BODY_ENCODER = json.JSONEncoder(sort_keys=True, separators=(',', ':'))
+
+    def _dumps_sorted(body: Any) -> bytes:
+        return _BODY_ENCODER.encode(body).encode('utf-8')
+
+
+def _body_bytes(body: Any) -> bytes:
+    """Stable byte form of a request body, independent of dict key order."""
+    if isinstance(body, bytes):
+        return body
+    if isinstance(body, str):
+        return body.encode('utf-8')
+    try:
+        return _dumps_sorted(body)
+    except (TypeError, ValueError):
+        # Not JSON-serializable (e.g. a file object or generator)
+        return repr(body).encode('utf-8')
+
+
+class _CacheEntry:
+    """A cached response with its insert time (monotonic ns) and size."""
+
+    __slots__ = ('response', 'timestamp', 'size')
+
+    def __init__(self, response: ResponseInfo, timestamp: int, size: int):
+        self.response = response
+        self.timestamp = timestamp
+        self.size = size
+
 
 class CachingMiddleware(RotatorMiddleware):
     """
     Middleware for caching GET requests.
     Thread-safe and supports both Sync/Async.
+
+    Pass ``thread_safe=False`` when the middleware is only ever used from a
+    single thread (e.g. one asyncio event loop) to skip the lock entirely.
     """
 
     def __init__(
@@ -25,18 +87,42 @@ class CachingMiddleware(RotatorMiddleware):
         max_cache_size: int = 1000,
         max_cache_size_bytes: int = 100 * 1024 * 1024,
         max_cacheable_size: int = 10 * 1024 * 1024,
-        logger: Optional[logging.Logger] = None
+        logger: Optional[logging.Logger] = None,
+        thread_safe: bool = True
     ):
-        self.cache: OrderedDict[str, Dict[str, Any]] = OrderedDict()
+        # Plain dicts keep insertion order, so the first key is the LRU entry
+        self.cache: Dict[str, _CacheEntry] = {}
         self.ttl = ttl
         self.cache_only_get = cache_only_get
+        self._get_cache_key = self._get_cache_key_get if cache_only_get else self._get_cache_key_full
+        self._url_keys: Dict[str, str] = {}
         self.max_cache_size = max(1, max_cache_size)
         self.max_cache_size_bytes = max_cache_size_bytes
         self.max_cacheable_size = max_cacheable_size
         self.logger = logger if logger else logging.getLogger(__name__)
-        self._lock = threading.RLock()
+        self._thread_safe = thread_safe
+        self._lock = threading.RLock() if thread_safe else nullcontext()
         self.hits = 0
         self.misses = 0
+        # Running sum of the 'size' of every cached entry
+        self._total_bytes = 0
+        # (timestamp, key) per insert. Timestamps are monotonic and the TTL
+        # is shared, so this is also expiry order and expired entries are
+        # always a prefix. The LRU order of self.cache can't serve here since
+        # hits move entries. Entries for keys that were since replaced or
+        # evicted are skipped when popped.
+        self._expiry_queue: Deque[Tuple[int, str]] = deque()
+
+    @property
+    def ttl(self) -> float:
+        return self._ttl
+
+    @ttl.setter
+    def ttl(self, ttl: float):
+        # Entry timestamps are time.monotonic_ns(): integer arithmetic and
+        # unaffected by wall-clock adjustments
+        self._ttl = ttl
+        self._ttl_ns = int(ttl * 1_000_000_000)
 
     # ... Helper methods (_get_response_size, _get_total_cache_size, _is_safe_to_cache, _get_cache_key, _evict_*) ...
     # Reuse previous implementations, omitting for brevity in this architectural fix unless requested,
@@ -47,101 +133,179 @@ class CachingMiddleware(RotatorMiddleware):
         if response_info.content:
             size += len(response_info.content)
         if response_info.headers:
-            size += len(str(response_info.headers))
+            # Roughly "Name: value\r\n" per header, without building a repr;
+            # values set by other middleware need not be strings
+            size += sum(
+                len(k) + (len(v) if isinstance(v, str) else len(str(v))) + 4
+                for k, v in response_info.headers.items()
+            )
         return size
 
     def _get_total_cache_size(self) -> int:
-        total = 0
-        for cached in self.cache.values():
-            if 'response' in cached:
-                total += self._get_response_size(cached['response'])
-        return total
-
-    def _is_safe_to_cache(self, response_info: ResponseInfo) -> bool:
-        if 'Set-Cookie' in response_info.headers or 'set-cookie' in response_info.headers:
+        return self._total_bytes
+
+    def _is_safe_to_cache(self, response_info: ResponseInfo, response_size: int) -> bool:
+        headers = response_info.headers
+        # The rotator passes the client's case-insensitive header mapping;
+        # only a plain dict (e.g. built by another middleware) needs the
+        # lower-case probe as well
+        if 'Set-Cookie' in headers or (isinstance(headers, dict) and 'set-cookie' in headers):
             return False
-        content_type = response_info.headers.get('Content-Type', '').lower()
-        if any(ct in content_type for ct in ['text/event-stream', 'multipart/x-mixed-replace']):
+        content_type = headers.get('Content-Type')
+        if content_type and _UNCACHEABLE_CONTENT_TYPE_RE.search(content_type):
             return False
-        cache_control = response_info.headers.get('Cache-Control', '').lower()
-        if 'no-store' in cache_control or 'private' in cache_control:
+        cache_control = headers.get('Cache-Control')
+        if cache_control and _UNCACHEABLE_CACHE_CONTROL_RE.search(cache_control):
             return False
-        if self._get_response_size(response_info) > self.max_cacheable_size:
+        if response_size > self.max_cacheable_size:
             return False
         return True
 
-    def _get_cache_key(self, request_info: RequestInfo) -> str:
-        key_parts = [request_info.method.upper(), request_info.url]
-        relevant_headers = {
-            k: v for k, v in request_info.headers.items()
-            if k.lower() not in ['authorization', 'x-api-key', 'user-agent', 'cookie']
-        }
-        if relevant_headers:
-            key_parts.append(json.dumps(relevant_headers, sort_keys=True))
-        if request_info.method.upper() in ['POST', 'PUT', 'PATCH']:
+    @staticmethod
+    def _is_get(method: str) -> bool:
+        # The rotator passes the method upper-cased already, so the exact
+        # comparison almost always decides without allocating a new string
+        return method == 'GET' or method.upper() == 'GET'
+
+    # The cache key is the request description itself: the dict hashes it
+    # far cheaper than a SHA-256 hexdigest and compares it exactly. Only a
+    # request body, which can be large, is reduced to a digest. URLs and
+    # header lines cannot contain a raw newline, so the separator keeps the
+    # parts unambiguous.
+
+    @staticmethod
+    def _header_key_parts(headers: Dict[str, str]) -> List[str]:
+        relevant_headers = []
+        if headers:
+            for k, v in headers.items():
+                name = k.lower()
+                if name not in _EXCLUDED_KEY_HEADERS:
+                    relevant_headers.append(f"{name}:{v}")
+            relevant_headers.sort()
+        return relevant_headers
+
+    def _get_cache_key_get(self, request_info: RequestInfo) -> str:
+        """Key for cache_only_get mode, where only GET requests get here."""
+        url = request_info.url
+        header_parts = self._header_key_parts(request_info.headers)
+        if header_parts:
+            return '\n'.join(['GET', url, *header_parts])
+        # A plain GET's key depends on the URL alone. Reusing one string per
+        # URL also lets the cache dict match it by identity, with its hash
+        # already computed.
+        key = self._url_keys.get(url)
+        if key is None:
+            if len(self._url_keys) >= _URL_KEY_MEMO_SIZE:
+                self._url_keys.clear()
+            key = self._url_keys[url] = 'GET\n' + url
+        return key
+
+    def _get_cache_key_full(self, request_info: RequestInfo) -> str:
+        method = request_info.method.upper()
+        key_parts = [method, request_info.url]
+        key_parts.extend(self._header_key_parts(request_info.headers))
+        if method in ('POST', 'PUT', 'PATCH'):
             body = request_info.kwargs.get('json') or request_info.kwargs.get('data')
             if body:
-                key_parts.append(repr(body))
-        return hashlib.sha256('|'.join(key_parts).encode()).hexdigest()
+                key_parts.append(hashlib.sha256(_body_bytes(body)).hexdigest())
+        return '\n'.join(key_parts)
 
     def _evict_expired(self):
-        current_time = time.time()
-        expired_keys = [k for k, v in self.cache.items() if current_time - v['timestamp'] >= self.ttl]
-        for key in expired_keys:
-            del self.cache[key]
+        queue = self._expiry_queue
+        expire_before = time.monotonic_ns() - self._ttl_ns
+        while queue and queue[0][0] <= expire_before:
+            timestamp, key = queue.popleft()
+            entry = self.cache.get(key)
+            if entry is not None and entry.timestamp == timestamp:
+                del self.cache[key]
+                self._total_bytes -= entry.size
+
+    def _track_expiry(self, timestamp: int, key: str):
+        queue = self._expiry_queue
+        queue.append((timestamp, key))
+        # Rebuild when stale entries dominate, e.g. under a long TTL
+        if len(queue) > 2 * len(self.cache) + 64:
+            self._expiry_queue = deque(sorted((v.timestamp, k) for k, v in self.cache.items()))
 
     def _evict_lru(self):
         if len(self.cache) > 0:
-            self.cache.popitem(last=False)
+            entry = self.cache.pop(next(iter(self.cache)))
+            self._total_bytes -= entry.size
+
+    def _touch(self, key: str, entry: _CacheEntry):
+        """Move a hit entry to the most recently used end."""
+        if not self._thread_safe:
+            self.cache[key] = self.cache.pop(key)
+        # Skipped while another thread holds the lock; the entry then just
+        # keeps its older LRU position
+        elif self._lock.acquire(blocking=False):
+            try:
+                if self.cache.get(key) is entry:
+                    self.cache[key] = self.cache.pop(key)
+            finally:
+                self._lock.release()
 
     # --- Sync Implementation ---
 
     def before_request_sync(self, request_info: RequestInfo) -> Union[RequestInfo, ResponseInfo]:
-        if self.cache_only_get and request_info.method.upper() != 'GET':
+        if self.cache_only_get and not self._is_get(request_info.method):
             return request_info
 
-        cache_key = self._get_cache_key(request_info)
+        cache_key = request_info._cache_key = self._get_cache_key(request_info)
+
+        # Fresh hits skip the lock: a dict read is atomic and entries are
+        # never modified once stored. The hit count is advisory and may
+        # rarely lose an increment between threads.
+        cached = self.cache.get(cache_key)
+        if cached is not None and time.monotonic_ns() - cached.timestamp < self._ttl_ns:
+            self.hits += 1
+            self._touch(cache_key, cached)
+            self.logger.info("✅ Cache HIT for %s", request_info.url)
+            return cached.response
+
         with self._lock:
-            if (self.hits + self.misses) % 100 == 0:
-                self._evict_expired()
+            self._evict_expired()
 
-            if cache_key in self.cache:
-                cached = self.cache[cache_key]
-                if time.time() - cached['timestamp'] < self.ttl:
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                if time.monotonic_ns() - cached.timestamp < self._ttl_ns:
                     self.hits += 1
-                    self.cache.move_to_end(cache_key)
-                    self.logger.info(f"✅ Cache HIT for {request_info.url}")
-                    return cached['response']
-                else:
-                    del self.cache[cache_key]
-                    self.misses += 1
-            else:
-                self.misses += 1
+                    self._touch(cache_key, cached)
+                    self.logger.info("✅ Cache HIT for %s", request_info.url)
+                    return cached.response
+                del self.cache[cache_key]
+                self._total_bytes -= cached.size
+            self.misses += 1
         return request_info
 
     def after_request_sync(self, response_info: ResponseInfo) -> ResponseInfo:
-        if self.cache_only_get and response_info.request_info.method.upper() != 'GET':
+        if self.cache_only_get and not self._is_get(response_info.request_info.method):
             return response_info
 
         if 200 <= response_info.status_code < 300:
-            if not self._is_safe_to_cache(response_info):
+            response_size = self._get_response_size(response_info)
+            if not self._is_safe_to_cache(response_info, response_size):
                 return response_info
 
-            cache_key = self._get_cache_key(response_info.request_info)
-            response_size = self._get_response_size(response_info)
+            request_info = response_info.request_info
+            # Reuse the key from before_request; it also keeps the entry
+            # under the key later lookups use even if another middleware
+            # changed the request's headers in between
+            cache_key = getattr(request_info, '_cache_key', None) or self._get_cache_key(request_info)
 
             with self._lock:
-                if cache_key not in self.cache:
-                    while len(self.cache) >= self.max_cache_size:
-                        self._evict_lru()
-                    while self._get_total_cache_size() + response_size > self.max_cache_size_bytes:
-                        if len(self.cache) == 0: break
-                        self._evict_lru()
-
-                self.cache[cache_key] = {
-                    'response': response_info,
-                    'timestamp': time.time()
-                }
+                previous = self.cache.pop(cache_key, None)
+                if previous is not None:
+                    self._total_bytes -= previous.size
+                while len(self.cache) >= self.max_cache_size:
+                    self._evict_lru()
+                while self.cache and self._total_bytes + response_size > self.max_cache_size_bytes:
+                    self._evict_lru()
+
+                timestamp = time.monotonic_ns()
+                self.cache[cache_key] = _CacheEntry(response_info, timestamp, response_size)
+                self._total_bytes += response_size
+                self._track_expiry(timestamp, cache_key)
         return response_info
 
     # --- Async Hooks ---
@@ -157,6 +321,7 @@ class CachingMiddleware(RotatorMiddleware):
             total = self.hits + self.misses
             return {
                 "cache_size": len(self.cache),
+                "cache_size_bytes": self._total_bytes,
                 "hits": self.hits,
                 "misses": self.misses,
                 "total": total
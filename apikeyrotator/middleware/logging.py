@@ -3,10 +3,29 @@ Middleware for logging
 """
 import logging
 import time
-from typing import Optional
+from typing import Dict, Optional
 from .base import RotatorMiddleware
 from .models import RequestInfo, ResponseInfo, ErrorInfo
 
+# Upper bound on memoized key masks / header names before the memo resets
+_MASK_MEMO_SIZE = 1024
+
+# Header names (lower-case) whose values are never logged
+_REDACTED_HEADERS = frozenset({'authorization', 'x-api-key', 'cookie', 'set-cookie'})
+
+# Header name as sent -> whether its value is redacted. The same names
+# recur on every request, so each spelling is lower-cased only once.
+_redacted_names: Dict[str, bool] = {}
+
+
+def _is_redacted(name: str) -> bool:
+    redacted = _redacted_names.get(name)
+    if redacted is None:
+        if len(_redacted_names) >= _MASK_MEMO_SIZE:
+            _redacted_names.clear()
+        redacted = _redacted_names[name] = name.lower() in _REDACTED_HEADERS
+    return redacted
+
 
 class LoggingMiddleware(RotatorMiddleware):
     """
@@ -42,6 +61,9 @@ class LoggingMiddleware(RotatorMiddleware):
 
         self.logger.setLevel(log_level)
 
+        # key -> masked form; each request masks the same key up to 3 times
+        self._masked_keys: Dict[str, str] = {}
+
         self._last_log_reset = time.time()
         self._log_count = 0
         self._dropped_logs = 0
@@ -51,7 +73,7 @@ class LoggingMiddleware(RotatorMiddleware):
         if current_time - self._last_log_reset >= 1.0:
             if self._dropped_logs > 0:
                 self.logger.warning(
-                    f"⚠️ Dropped {self._dropped_logs} log messages due to rate limiting"
+                    "⚠️ Dropped %d log messages due to rate limiting", self._dropped_logs
                 )
             self._last_log_reset = current_time
             self._log_count = 0
@@ -65,45 +87,47 @@ class LoggingMiddleware(RotatorMiddleware):
         return True
 
     def _mask_key(self, key: str) -> str:
-        if len(key) <= self.max_key_chars:
-            return key[:self.max_key_chars] + "****"
-        return key[:self.max_key_chars] + "****"
+        masked = self._masked_keys.get(key)
+        if masked is None:
+            if len(self._masked_keys) >= _MASK_MEMO_SIZE:
+                self._masked_keys.clear()
+            masked = self._masked_keys[key] = key[:self.max_key_chars] + "****"
+        return masked
 
     def _format_headers(self, headers: dict) -> str:
-        safe_headers = {}
-        sensitive_keys = ['authorization', 'x-api-key', 'cookie', 'set-cookie']
-        for key, value in headers.items():
-            if key.lower() in sensitive_keys:
-                safe_headers[key] = "[REDACTED]"
-            else:
-                safe_headers[key] = value
-        return str(safe_headers)
+        for key in headers:
+            if _is_redacted(key):
+                break
+        else:
+            # Nothing to redact: format the headers as they are
+            return str(headers if isinstance(headers, dict) else dict(headers.items()))
+        return str({
+            key: "[REDACTED]" if _is_redacted(key) else value
+            for key, value in headers.items()
+        })
 
     # --- Implementation (Common Logic) ---
 
     def _log_request(self, request_info: RequestInfo):
-        if not self._should_log():
+        # Everything below is INFO or DEBUG
+        if not self.logger.isEnabledFor(logging.INFO) or not self._should_log():
             return
 
         if self.verbose:
-            masked_key = self._mask_key(request_info.key)
-            headers_str = self._format_headers(request_info.headers)
             self.logger.info(
-                f"📤 {request_info.method} {request_info.url} "
-                f"(key: {masked_key}, attempt: {request_info.attempt + 1})"
+                "📤 %s %s (key: %s, attempt: %d)",
+                request_info.method, request_info.url,
+                self._mask_key(request_info.key), request_info.attempt + 1
             )
-            self.logger.debug(f"Headers: {headers_str}")
-            if request_info.kwargs.get('json'):
-                self.logger.debug(f"JSON body: {request_info.kwargs['json']}")
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug("Headers: %s", self._format_headers(request_info.headers))
+                if request_info.kwargs.get('json'):
+                    self.logger.debug("JSON body: %s", request_info.kwargs['json'])
         else:
-            self.logger.info(f"📤 {request_info.method} {request_info.url}")
+            self.logger.info("📤 %s %s", request_info.method, request_info.url)
 
     def _log_response(self, response_info: ResponseInfo):
-        if not self._should_log():
-            return
-
         status = response_info.status_code
-        url = response_info.request_info.url
 
         if 200 <= status < 300:
             log_level = logging.INFO
@@ -115,39 +139,42 @@ class LoggingMiddleware(RotatorMiddleware):
             log_level = logging.ERROR
             emoji = "📥 ❌"
 
-        message = f"{emoji} {status} from {url}"
+        if not self.logger.isEnabledFor(log_level) or not self._should_log():
+            return
+
+        message = f"{emoji} {status} from {response_info.request_info.url}"
 
         if self.verbose:
-            masked_key = self._mask_key(response_info.request_info.key)
-            message += f" (key: {masked_key})"
+            message += f" (key: {self._mask_key(response_info.request_info.key)})"
 
-        if self.log_response_time and hasattr(response_info, 'response_time'):
+        if self.log_response_time and response_info.response_time is not None:
             message += f" ({response_info.response_time:.3f}s)"
 
         self.logger.log(log_level, message)
 
         if self.verbose and self.logger.isEnabledFor(logging.DEBUG):
             self.logger.debug(
-                f"Response headers: {self._format_headers(response_info.headers)}"
+                "Response headers: %s", self._format_headers(response_info.headers)
             )
 
     def _log_error(self, error_info: ErrorInfo):
-        if not self._should_log():
+        if not self.logger.isEnabledFor(logging.ERROR) or not self._should_log():
             return
 
         exception = error_info.exception
-        url = error_info.request_info.url
-        masked_key = self._mask_key(error_info.request_info.key)
 
         self.logger.error(
-            f"❌ Error for {url}: {type(exception).__name__}: {str(exception)}"
+            "❌ Error for %s: %s: %s",
+            error_info.request_info.url, type(exception).__name__, exception
         )
 
         if self.verbose:
-            self.logger.error(f"   Key: {masked_key}, Attempt: {error_info.request_info.attempt + 1}")
-            if self.logger.isEnabledFor(logging.DEBUG):
-                import traceback
-                self.logger.debug(f"Traceback:\n{''.join(traceback.format_tb(exception.__traceback__))}")
+            self.logger.error(
+                "   Key: %s, Attempt: %d",
+                self._mask_key(error_info.request_info.key), error_info.request_info.attempt + 1
+            )
+            # The handler formats the traceback only if it emits the record
+            self.logger.debug("Traceback:", exc_info=exception)
 
     # --- Sync Hooks ---
 
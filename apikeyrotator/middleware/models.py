@@ -1,11 +1,15 @@
 """Data models for middleware"""
 
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Mapping, Optional
 
 
 class RequestInfo:
     """Information about an HTTP request"""
 
+    # _cache_key lets CachingMiddleware reuse the key computed before the
+    # request when it stores the response
+    __slots__ = ('method', 'url', 'headers', 'cookies', 'key', 'attempt', 'kwargs', '_cache_key')
+
     def __init__(
             self,
             method: str,
@@ -23,15 +27,18 @@ class RequestInfo:
         self.key = key
         self.attempt = attempt
         self.kwargs = kwargs
+        self._cache_key: Optional[str] = None
 
 
 class ResponseInfo:
     """Information about an HTTP response"""
 
+    __slots__ = ('status_code', 'headers', 'content', 'request_info', 'response_time')
+
     def __init__(
             self,
             status_code: int,
-            headers: Dict[str, str],
+            headers: Mapping[str, str],
             content: Any,
             request_info: RequestInfo
     ):
@@ -39,11 +46,14 @@ class ResponseInfo:
         self.headers = headers
         self.content = content
         self.request_info = request_info
+        self.response_time: Optional[float] = None
 
 
 class ErrorInfo:
     """Information about an error"""
 
+    __slots__ = ('exception', 'request_info', 'response_info')
+
     def __init__(
             self,
             exception: Exception,
@@ -4,17 +4,53 @@ Middleware for rate-limiting management
 
 import time
 import asyncio
+import heapq
+import itertools
 import logging
 import random
 import threading
-from typing import Dict, Any, Optional
+from email.utils import parsedate_to_datetime
+from typing import Dict, Any, List, Optional, Tuple
 from .base import RotatorMiddleware
 from .models import RequestInfo, ResponseInfo, ErrorInfo
 
+# Number of per-key lock stripes (a power of two)
+_LOCK_STRIPES = 16
+
+# Entry field -> response headers (lower-case) it is read from, in priority
+# order: the X- prefixed form first, then the unprefixed one
+_RATE_LIMIT_FIELDS = (
+    ('limit', ('x-ratelimit-limit', 'ratelimit-limit')),
+    ('remaining', ('x-ratelimit-remaining', 'ratelimit-remaining')),
+    ('reset_time', ('x-ratelimit-reset', 'ratelimit-reset')),
+)
+_RATE_LIMIT_HEADERS = frozenset(name for _, names in _RATE_LIMIT_FIELDS for name in names)
+
+
+def _monotonic_deadline(reset_time: float) -> float:
+    """Convert a wall-clock reset timestamp to a time.monotonic() deadline."""
+    return time.monotonic() + (reset_time - time.time())
+
+
+def _retry_after_seconds(value: str) -> Optional[float]:
+    """Parse a Retry-After value: delay in seconds or an HTTP-date."""
+    try:
+        return int(value)
+    except (ValueError, TypeError):
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (ValueError, TypeError, IndexError, OverflowError):
+        return None
+
 
 class RateLimitMiddleware(RotatorMiddleware):
     """
     Middleware for tracking rate limits.
+
+    Each entry keeps the server's wall-clock ``reset_time`` for reference,
+    while waits and expiry use ``reset_at``, the same moment on the
+    ``time.monotonic()`` clock, so they are unaffected by system clock jumps.
     """
 
     def __init__(
@@ -35,47 +71,108 @@ class RateLimitMiddleware(RotatorMiddleware):
 
         self.logger = logger if logger else logging.getLogger(__name__)
 
-        # Thread-safety
+        # Thread-safety. Updates to one key take that key's stripe lock, so
+        # different keys don't serialize. The coarse lock is only taken to
+        # add keys and for sweeps, which iterate over the whole dict.
+        # Single dict reads need no lock.
         self._lock = threading.RLock()
+        self._key_locks = [threading.Lock() for _ in range(_LOCK_STRIPES)]
+
+        # Counter for periodic cleanup; next() on it is atomic
+        self._request_counter = itertools.count(1)
 
-        # Counter for periodic cleanup
-        self._request_count = 0
+        # Current reset_at of each key whose reset has not yet been seen to
+        # pass, plus a (reset_at, key) min-heap to drop them once it has.
+        # get_stats() then counts active limits without walking every entry.
+        # Heap items whose key has since moved to another deadline are stale
+        # and skipped.
+        self._deadlines: Dict[str, float] = {}
+        self._deadline_heap: List[Tuple[float, str]] = []
+        self._deadline_lock = threading.Lock()
 
         self.logger.info(
-            f"RateLimitMiddleware initialized: pause_on_limit={pause_on_limit}, "
-            f"max_tracked_keys={self.max_tracked_keys}"
+            "RateLimitMiddleware initialized: pause_on_limit=%s, max_tracked_keys=%d",
+            pause_on_limit, self.max_tracked_keys
         )
 
-    def _cleanup_expired(self):
-        current_time = time.time()
+    def _cleanup_expired(self, now: float):
         expired_keys = []
 
         for key, limit_info in self.rate_limits.items():
-            reset_time = limit_info.get('reset_time', 0)
+            reset_at = limit_info.get('reset_at')
             # Remove if reset was more than 1 hour ago
-            if reset_time > 0 and reset_time < current_time - 3600:
+            if reset_at is not None and reset_at < now - 3600:
                 expired_keys.append(key)
 
-        for key in expired_keys:
-            del self.rate_limits[key]
+        self._forget(expired_keys)
 
         if expired_keys:
-            self.logger.debug(f"Cleaned up {len(expired_keys)} expired rate limit entries")
+            self.logger.debug("Cleaned up %d expired rate limit entries", len(expired_keys))
 
     def _evict_oldest(self):
         if len(self.rate_limits) >= self.max_tracked_keys:
-            # Sort by reset_time and remove oldest
-            sorted_keys = sorted(
+            # Remove the 10% with the oldest reset time; selecting them
+            # is O(N log k) where a full sort would be O(N log N)
+            to_remove = max(1, len(self.rate_limits) // 10)
+            oldest = heapq.nsmallest(
+                to_remove,
                 self.rate_limits.items(),
-                key=lambda x: x[1].get('reset_time', 0)
+                key=lambda x: x[1].get('reset_at', float('-inf'))
             )
+            self._forget([key for key, _ in oldest])
+
+            self.logger.debug("Evicted %d oldest rate limit entries", to_remove)
 
-            # Remove 10% oldest
-            to_remove = max(1, len(sorted_keys) // 10)
-            for key, _ in sorted_keys[:to_remove]:
-                del self.rate_limits[key]
+    def _forget(self, keys: List[str]) -> None:
+        """Drop entries (called under the coarse lock) and their deadlines."""
+        for key in keys:
+            del self.rate_limits[key]
+        with self._deadline_lock:
+            for key in keys:
+                self._deadlines.pop(key, None)
 
-            self.logger.debug(f"Evicted {to_remove} oldest rate limit entries")
+    def _lock_for(self, key: str) -> threading.Lock:
+        return self._key_locks[hash(key) & (_LOCK_STRIPES - 1)]
+
+    def _merge(self, key: str, limit_info: Dict[str, Any]) -> None:
+        """
+        Merge limit_info into the key's entry, adding the key if needed.
+
+        Keys are only added here, under their stripe lock, while sweeps
+        drop entries under the coarse lock alone. An entry evicted during
+        the in-place update is therefore re-checked under the coarse lock
+        and put back, so the update is not lost.
+        """
+        with self._lock_for(key):
+            current = self.rate_limits.get(key)
+            if current is not None:
+                # Mutates the entry in place, so a concurrent sweep never
+                # sees the dict change size
+                current.update(limit_info)
+            if current is None or self.rate_limits.get(key) is not current:
+                with self._lock:
+                    if key not in self.rate_limits:
+                        self._evict_oldest()
+                        self.rate_limits[key] = limit_info if current is None else current
+            if 'reset_at' in limit_info:
+                self._track_deadline(key, limit_info['reset_at'])
+                # A sweep that dropped the key after the insert above may
+                # have run before the deadline was recorded
+                if key not in self.rate_limits:
+                    with self._deadline_lock:
+                        self._deadlines.pop(key, None)
+
+    def _track_deadline(self, key: str, reset_at: float) -> None:
+        with self._deadline_lock:
+            if self._deadlines.get(key) == reset_at:
+                return
+            self._deadlines[key] = reset_at
+            heap = self._deadline_heap
+            heapq.heappush(heap, (reset_at, key))
+            # Rebuild when stale items dominate
+            if len(heap) > 2 * len(self._deadlines) + 64:
+                self._deadline_heap = [(t, k) for k, t in list(self._deadlines.items())]
+                heapq.heapify(self._deadline_heap)
 
     def _get_header_nocase(self, headers: Dict[str, str], key: str) -> Optional[str]:
         """Helper to get header value ignoring case."""
@@ -84,7 +181,11 @@ class RateLimitMiddleware(RotatorMiddleware):
         # Direct lookup first (fastest)
         if key in headers:
             return headers[key]
-        # Case-insensitive lookup
+        # The rotator passes the client's case-insensitive header mapping,
+        # where the lookup above already decided; only a plain dict needs
+        # the scan
+        if not isinstance(headers, dict):
+            return None
         key_lower = key.lower()
         for k, v in headers.items():
             if k.lower() == key_lower:
@@ -94,94 +195,72 @@ class RateLimitMiddleware(RotatorMiddleware):
     def _extract_rate_limit_info(self, headers: Dict[str, str]) -> Dict[str, Any]:
         """Extract rate limit information from response headers."""
         rate_limit_info = {}
-
-        # Standard rate-limit headers
-        limit = self._get_header_nocase(headers, 'X-RateLimit-Limit')
-        if limit:
-            try:
-                rate_limit_info['limit'] = int(limit)
-            except (ValueError, TypeError):
-                pass
-
-        remaining = self._get_header_nocase(headers, 'X-RateLimit-Remaining')
-        if remaining:
-            try:
-                rate_limit_info['remaining'] = int(remaining)
-            except (ValueError, TypeError):
-                pass
-
-        reset = self._get_header_nocase(headers, 'X-RateLimit-Reset')
-        if reset:
-            try:
-                rate_limit_info['reset_time'] = int(reset)
-            except (ValueError, TypeError):
-                pass
-
-        # Alternative header names (no prefix)
-        if 'limit' not in rate_limit_info:
-            limit = self._get_header_nocase(headers, 'RateLimit-Limit')
-            if limit:
-                try:
-                    rate_limit_info['limit'] = int(limit)
-                except (ValueError, TypeError): pass
-
-        if 'remaining' not in rate_limit_info:
-            remaining = self._get_header_nocase(headers, 'RateLimit-Remaining')
-            if remaining:
-                try:
-                    rate_limit_info['remaining'] = int(remaining)
-                except (ValueError, TypeError): pass
-
-        if 'reset_time' not in rate_limit_info:
-            reset = self._get_header_nocase(headers, 'RateLimit-Reset')
-            if reset:
-                try:
-                    rate_limit_info['reset_time'] = int(reset)
-                except (ValueError, TypeError): pass
+        if not headers:
+            return rate_limit_info
+
+        if isinstance(headers, dict):
+            # A plain dict is scanned once rather than once per header name;
+            # most responses carry none of these
+            found = {}
+            for name, value in headers.items():
+                name = name.lower()
+                if name in _RATE_LIMIT_HEADERS and name not in found:
+                    found[name] = value
+            if not found:
+                return rate_limit_info
+        else:
+            # Case-insensitive client mappings answer each name directly
+            found = {name: self._get_header_nocase(headers, name) for name in _RATE_LIMIT_HEADERS}
+
+        for field, names in _RATE_LIMIT_FIELDS:
+            for name in names:
+                value = found.get(name)
+                if value:
+                    try:
+                        rate_limit_info[field] = int(value)
+                        break
+                    except (ValueError, TypeError):
+                        pass
 
         return rate_limit_info
 
     def _store_rate_limit_info(self, key: str, rate_limit_info: Dict[str, Any]) -> None:
         """Store rate limit info for a key."""
         if rate_limit_info:
-            with self._lock:
-                if key not in self.rate_limits:
-                    self._evict_oldest()
-
-                if key in self.rate_limits:
-                    self.rate_limits[key].update(rate_limit_info)
-                else:
-                    self.rate_limits[key] = rate_limit_info
+            if 'reset_time' in rate_limit_info:
+                rate_limit_info['reset_at'] = _monotonic_deadline(rate_limit_info['reset_time'])
+            self._merge(key, rate_limit_info)
 
-            self.logger.debug(
-                f"Updated rate limit for key {key[:4]}****: "
-                f"limit={rate_limit_info.get('limit', '?')}, "
-                f"remaining={rate_limit_info.get('remaining', '?')}"
-            )
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug(
+                    "Updated rate limit for key %s****: limit=%s, remaining=%s",
+                    key[:4], rate_limit_info.get('limit', '?'), rate_limit_info.get('remaining', '?')
+                )
 
     def _check_rate_limit(self, key: str) -> float:
         """Check if key is rate-limited and return wait time."""
         wait_time = 0.0
 
-        with self._lock:
-            self._request_count += 1
-            if self._request_count % 50 == 0:
-                self._cleanup_expired()
+        now = time.monotonic()
+
+        if next(self._request_counter) % 50 == 0:
+            with self._lock:
+                self._cleanup_expired(now)
                 self._evict_oldest()
 
-            if key in self.rate_limits:
-                limit_info = self.rate_limits[key]
-                reset_time = limit_info.get('reset_time', 0)
+        limit_info = self.rate_limits.get(key)
+        if limit_info is not None:
+            reset_at = limit_info.get('reset_at')
 
-                if self.pause_on_limit and reset_time > time.time():
-                    wait_time = reset_time - time.time()
-                    jitter = random.uniform(0, wait_time * 0.1)
-                    wait_time += jitter
+            if self.pause_on_limit and reset_at is not None and reset_at > now:
+                wait_time = reset_at - now
+                jitter = random.uniform(0, wait_time * 0.1)
+                wait_time += jitter
 
-                    self.logger.warning(
-                        f"⏸️ Rate limit for key {key[:4]}****. Waiting {wait_time:.1f}s "
-                        f"(remaining={limit_info.get('remaining', '?')})"
-                    )
+                self.logger.warning(
+                    "⏸️ Rate limit for key %s****. Waiting %.1fs (remaining=%s)",
+                    key[:4], wait_time, limit_info.get('remaining', '?')
+                )
 
         return wait_time
 
@@ -199,16 +278,11 @@ class RateLimitMiddleware(RotatorMiddleware):
 
             # Try to extract Retry-After header
             retry_after = self._get_header_nocase(headers, 'Retry-After')
+            delay = _retry_after_seconds(retry_after) if retry_after else None
             reset_time = None
 
-            if retry_after:
-                try:
-                    reset_time = time.time() + int(retry_after)
-                except (ValueError, TypeError):
-                    pass
-
             # Fallback to X-RateLimit-Reset
-            if not reset_time:
+            if delay is None:
                 reset_val = self._get_header_nocase(headers, 'X-RateLimit-Reset')
                 if reset_val:
                     try:
@@ -217,21 +291,23 @@ class RateLimitMiddleware(RotatorMiddleware):
                         pass
 
             # Default: wait 60 seconds
-            if not reset_time:
-                reset_time = time.time() + 60
+            if delay is None and not reset_time:
+                delay = 60
 
-            with self._lock:
-                if key not in self.rate_limits:
-                    self._evict_oldest()
+            if delay is not None:
+                reset_at = time.monotonic() + delay
+                reset_time = time.time() + delay
+            else:
+                reset_at = _monotonic_deadline(reset_time)
 
-                self.rate_limits[key] = {
-                    'reset_time': reset_time,
-                    'remaining': 0
-                }
+            self._merge(key, {
+                'reset_time': reset_time,
+                'reset_at': reset_at,
+                'remaining': 0
+            })
 
             self.logger.warning(
-                f"⚠️ Rate limit hit for key {key[:4]}****. "
-                f"Reset at {reset_time}"
+                "⚠️ Rate limit hit for key %s****. Reset at %s", key[:4], reset_time
             )
 
         return True
@@ -282,14 +358,17 @@ class RateLimitMiddleware(RotatorMiddleware):
         """
         Returns statistics about tracked rate limits.
         """
-        with self._lock:
-            active_limits = sum(
-                1 for info in self.rate_limits.values()
-                if info.get('reset_time', 0) > time.time()
-            )
-
-            return {
-                'tracked_keys': len(self.rate_limits),
-                'active_limits': active_limits,
-                'max_tracked_keys': self.max_tracked_keys
-            }
+        now = time.monotonic()
+        with self._deadline_lock:
+            heap = self._deadline_heap
+            while heap and heap[0][0] <= now:
+                reset_at, key = heapq.heappop(heap)
+                if self._deadlines.get(key) == reset_at:
+                    self._deadlines.pop(key, None)
+            active_limits = len(self._deadlines)
+
+        return {
+            'tracked_keys': len(self.rate_limits),
+            'active_limits': active_limits,
+            'max_tracked_keys': self.max_tracked_keys
+        }
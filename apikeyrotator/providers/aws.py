@@ -3,7 +3,21 @@
 import json
 import logging
 import asyncio
-from typing import List, Optional
+import time
+from typing import Any, Iterable, List, Optional, Tuple
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# orjson's decode error subclasses json.JSONDecodeError
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+
+def _clean_keys(items: Iterable[Any]) -> List[str]:
+    """Stringify and strip each item once, dropping empty ones."""
+    return [k for k in (str(item).strip() for item in items) if k]
 
 
 class AWSSecretsManagerProvider:
@@ -17,18 +31,25 @@ class AWSSecretsManagerProvider:
     - JSON object: {"keys": ["key1", "key2"]} or {"api_keys": ["key1", "key2"]}
     - JSON string: "key1,key2,key3"
     - Plain string: key1,key2,key3
+
+    Successfully loaded keys are reused for ``cache_ttl`` seconds, so bursts
+    of refreshes don't each call AWS. Pass ``cache_ttl=0`` to always fetch.
     """
 
     def __init__(
         self,
         secret_name: str,
         region_name: str = 'us-east-1',
-        logger: Optional[logging.Logger] = None
+        logger: Optional[logging.Logger] = None,
+        cache_ttl: float = 30.0
     ):
         self.secret_name = secret_name
         self.region_name = region_name
         self._client = None
         self.logger = logger if logger else logging.getLogger(__name__)
+        self.cache_ttl = cache_ttl
+        # (time.monotonic() of the fetch, keys)
+        self._cache: Optional[Tuple[float, List[str]]] = None
 
     def _get_client(self):
         """Creates or returns boto3 client"""
@@ -48,6 +69,18 @@ class AWSSecretsManagerProvider:
         return self._client
 
     async def get_keys(self) -> List[str]:
+        cached = self._cache
+        if cached is not None and time.monotonic() - cached[0] < self.cache_ttl:
+            return list(cached[1])
+
+        keys = await self._fetch_keys()
+        # Errors come back as an empty list; don't hold on to those
+        if not keys:
+            return []
+        self._cache = (time.monotonic(), keys)
+        return list(keys)
+
+    async def _fetch_keys(self) -> List[str]:
         from ..utils import retry_with_backoff
 
         def _get_secret_value():
@@ -60,10 +93,10 @@ class AWSSecretsManagerProvider:
 
                     # Try parsing as JSON
                     try:
-                        keys_data = json.loads(secret)
+                        keys_data = _json_loads(secret)
 
                         if isinstance(keys_data, list):
-                            return [str(k).strip() for k in keys_data if str(k).strip()]
+                            return _clean_keys(keys_data)
                         elif isinstance(keys_data, dict):
                             # Extract from 'keys' or 'api_keys'
                             keys_list = keys_data.get('keys') or keys_data.get('api_keys')
@@ -72,32 +105,34 @@ class AWSSecretsManagerProvider:
                                 keys_list = list(keys_data.values())
 
                             if isinstance(keys_list, list):
-                                return [str(k).strip() for k in keys_list if str(k).strip()]
+                                return _clean_keys(keys_list)
                             elif isinstance(keys_list, str):
-                                return [k.strip() for k in keys_list.split(',') if k.strip()]
+                                return _clean_keys(keys_list.split(','))
                         elif isinstance(keys_data, str):
-                            return [k.strip() for k in keys_data.split(',') if k.strip()]
+                            return _clean_keys(keys_data.split(','))
 
                     except json.JSONDecodeError:
                         # Not JSON - parse as CSV
-                        return [k.strip() for k in secret.split(',') if k.strip()]
+                        return _clean_keys(secret.split(','))
 
                 return []
 
             except client.exceptions.ResourceNotFoundException:
-                self.logger.error(f"Secret {self.secret_name} not found in AWS Secrets Manager")
+                self.logger.error("Secret %s not found in AWS Secrets Manager", self.secret_name)
                 return []
-            except Exception as e:
-                self.logger.error(f"Error retrieving secret {self.secret_name}: {e}")
+            except Exception:
+                self.logger.exception("Error retrieving secret %s", self.secret_name)
                 return []
 
         try:
             # Run sync boto3 call in executor to avoid blocking event loop
             loop = asyncio.get_running_loop()
             return await loop.run_in_executor(None, retry_with_backoff, _get_secret_value, 3, 1.0, Exception)
-        except Exception as e:
-            self.logger.error(f"Failed to get keys after retries: {e}")
+        except Exception:
+            self.logger.exception("Failed to get keys for secret %s after retries", self.secret_name)
             return []
 
-    async def refresh_keys(self) -> List[str]:
+    async def refresh_keys(self, force_refresh: bool = False) -> List[str]:
+        if force_refresh:
+            self._cache = None
         return await self.get_keys()
@@ -139,16 +139,21 @@ class KeyMetrics:
             # Key is considered unhealthy if:
             # - 3+ consecutive failures
             # - Success rate < 0.3
-            # - Rate limit active and not yet expired
+            # An active rate limit is checked against rate_limit_reset where
+            # keys are selected, so the key is usable again once it lapses
             if self.consecutive_failures >= 3:
                 self.is_healthy = False
             elif self.success_rate < 0.3 and self.total_requests > 10:
                 self.is_healthy = False
-            elif self.rate_limit_reset > time.time():
-                self.is_healthy = False
             else:
                 self.is_healthy = True
 
+    def reset_health(self) -> None:
+        """Marks the key healthy again and clears its failure streak (thread-safe)"""
+        with self._lock:
+            self.is_healthy = True
+            self.consecutive_failures = 0
+
     def get_score(self) -> float:
         """
         Computes key score for weighted/health-based strategies.
@@ -205,15 +210,17 @@ class BaseRotationStrategy(ABC):
         if isinstance(keys, dict):
             if not keys:
                 raise ValueError("Keys dictionary cannot be empty")
-            self._keys = list(keys.keys())
+            self._keys = tuple(keys)
             self._weights = keys
         else:
             if not keys:
                 raise ValueError("Keys list cannot be empty")
-            self._keys = list(keys)  # Copy for safety
+            # Immutable, so a tuple passed in is shared rather than copied
+            self._keys = tuple(keys)
             self._weights = None
 
-        # Thread-safety for strategies
+        # Thread-safety for strategies. self._keys is an immutable tuple that
+        # writers rebind, so readers can use it unlocked.
         self._lock = threading.RLock()
 
         # Исправлено: инициализация логгера
@@ -246,7 +253,33 @@ class BaseRotationStrategy(ABC):
             new_keys: Updated list of API keys
         """
         with self._lock:
-            self._keys = list(new_keys)
+            self._keys = tuple(new_keys)
+
+    def remove_key(self, key: str) -> bool:
+        """
+        Removes a single key in place, keeping the rest of the strategy state.
+
+        A subclass that keeps its own state in update_keys() but does not
+        override this method is notified through update_keys() instead.
+
+        Args:
+            key: API key to remove
+
+        Returns:
+            bool: True if the key was present
+        """
+        with self._lock:
+            keys = self._keys
+            try:
+                i = keys.index(key)
+            except ValueError:
+                return False
+            remaining = keys[:i] + keys[i + 1:]
+            if type(self).update_keys is not BaseRotationStrategy.update_keys:
+                self.update_keys(list(remaining))
+            else:
+                self._keys = remaining
+            return True
 
     def update_key_metrics(
             self,
@@ -269,6 +302,14 @@ class BaseRotationStrategy(ABC):
         """
         pass  # By default do nothing
 
+    @staticmethod
+    def _is_available(metrics: Optional[KeyMetrics], now: float) -> bool:
+        """
+        Whether a key can be used right now: it has no metrics yet, or it is
+        healthy and its rate limit has expired.
+        """
+        return metrics is None or (metrics.is_healthy and metrics.rate_limit_reset <= now)
+
     def _get_healthy_keys(
         self,
         current_key_metrics: Optional[Dict[str, KeyMetrics]] = None
@@ -282,22 +323,18 @@ class BaseRotationStrategy(ABC):
         Returns:
             List[str]: List of healthy keys
         """
-        with self._lock:
-            if current_key_metrics is None:
-                return self._keys.copy()
-
-            healthy = []
-            for key in self._keys:
-                if key in current_key_metrics:
-                    metrics = current_key_metrics[key]
-                    # Key is healthy if:
-                    # - is_healthy = True
-                    # - rate limit expired
-                    if metrics.is_healthy and metrics.rate_limit_reset <= time.time():
-                        healthy.append(key)
-                else:
-                    # If no metrics, consider key healthy
-                    healthy.append(key)
-
-            # If no healthy keys, return all
-            return healthy if healthy else self._keys.copy()
\ No newline at end of file
+        # self._keys is an immutable tuple that is only ever rebound, so a
+        # plain read is a consistent snapshot and needs no lock. This also
+        # keeps callers that already hold self._lock from re-entering it.
+        keys = self._keys
+        if current_key_metrics is None:
+            return list(keys)
+
+        now = time.time()
+        healthy = [
+            key for key in keys
+            if self._is_available(current_key_metrics.get(key), now)
+        ]
+
+        # If no healthy keys, return all
+        return healthy if healthy else list(keys)
\ No newline at end of file
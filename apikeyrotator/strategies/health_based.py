@@ -2,21 +2,50 @@
 Health-Based rotation strategy
 """
 
+import math
 import time
 import random
 import asyncio
-from typing import List, Dict, Optional
+from functools import reduce
+from typing import List, Dict, Mapping, Optional, Tuple
 from .base import BaseRotationStrategy, KeyMetrics
 
 
+def _interleave(weighted: List[Tuple[str, int]]) -> List[str]:
+    """
+    One period of interleaved weighted round-robin (the IPVS scheduler):
+    each key appears weight/gcd times, spread out rather than in runs.
+    """
+    weights = [w for _, w in weighted]
+    gcd = reduce(math.gcd, weights)
+    max_weight = max(weights)
+    length = sum(weights) // gcd
+
+    schedule = []
+    i, current_weight = -1, 0
+    while len(schedule) < length:
+        i = (i + 1) % len(weighted)
+        if i == 0:
+            current_weight -= gcd
+            if current_weight <= 0:
+                current_weight = max_weight
+        if weights[i] >= current_weight:
+            schedule.append(weighted[i][0])
+    return schedule
+
+
 class HealthBasedStrategy(BaseRotationStrategy):
     """
     Strategy based on key health.
 
-    Selects only healthy keys (without consecutive failures).
+    Selects only healthy keys (without consecutive failures), in weighted
+    round-robin order with weights from each key's success rate.
     Unhealthy keys are automatically excluded from rotation and periodically
     rechecked after health_check_interval.
 
+    The order is precomputed as a schedule that is rebuilt once per pass,
+    or earlier when a key's health or weight changes, so a pick is O(1).
+
     Attributes:
         failure_threshold: Number of consecutive failures to mark a key as unhealthy
         health_check_interval: Interval in seconds for rechecking unhealthy keys
@@ -53,58 +82,88 @@ class HealthBasedStrategy(BaseRotationStrategy):
             key: KeyMetrics(key) for key in keys
         }
 
+        # Metrics mapping last copied into _key_metrics. The rotator passes
+        # a read-only view it replaces whenever its key set changes, so the
+        # same object means nothing to copy.
+        self._synced_metrics: Optional[Mapping[str, KeyMetrics]] = None
+        self._schedule: List[str] = []
+        self._schedule_idx = 0
+        self._schedule_dirty = True
+
+    @staticmethod
+    def _weight(metrics: KeyMetrics) -> int:
+        return int(metrics.success_rate * 10) + 1
+
+    def _is_eligible(self, metrics: KeyMetrics, now: float) -> bool:
+        if metrics.rate_limit_reset > now:
+            return False
+        return metrics.is_healthy or now - metrics.last_used > self.health_check_interval
+
+    def _rebuild_schedule(self, now: float) -> None:
+        weighted = [
+            (k, self._weight(metrics)) for k, metrics in self._key_metrics.items()
+            if self._is_eligible(metrics, now)
+        ]
+        self._schedule = _interleave(weighted) if weighted else []
+        self._schedule_idx = 0
+        self._schedule_dirty = False
+
     def get_next_key(
             self,
             current_key_metrics: Optional[Dict[str, KeyMetrics]] = None
     ) -> str:
         """
-        Selects a random healthy key.
+        Selects the next healthy key in weighted round-robin order.
         FIXED #10: Staggered recovery instead of all-at-once.
 
         Args:
             current_key_metrics: Current key metrics from rotator
 
         Returns:
-            str: Random healthy key
+            str: Healthy key
 
         Raises:
             Exception: If no healthy keys available
         """
-        # Use external metrics if provided
-        if current_key_metrics:
-            for key, metrics in current_key_metrics.items():
-                if key in self._key_metrics:
-                    self._key_metrics[key] = metrics
-
-        # Find healthy keys or those ready for recheck
-        current_time = time.time()
-        healthy_keys = [
-            k for k, metrics in self._key_metrics.items()
-            if metrics.is_healthy or (
-                    current_time - metrics.last_used > self.health_check_interval
-            )
-        ]
+        with self._lock:
+            # Use external metrics if provided
+            if current_key_metrics and current_key_metrics is not self._synced_metrics:
+                for key, metrics in current_key_metrics.items():
+                    if key in self._key_metrics:
+                        self._key_metrics[key] = metrics
+                self._synced_metrics = current_key_metrics
+                self._schedule_dirty = True
+
+            current_time = time.time()
+            # A key may have turned unhealthy since the schedule was built
+            # (the rotator updates metrics directly); skipping it forces a
+            # rebuild, after which the first key is eligible
+            for _ in range(2):
+                if self._schedule_dirty or self._schedule_idx >= len(self._schedule):
+                    self._rebuild_schedule(current_time)
+                if not self._schedule:
+                    break
+                key = self._schedule[self._schedule_idx]
+                self._schedule_idx += 1
+                metrics = self._key_metrics[key]
+                if self._is_eligible(metrics, current_time):
+                    metrics.last_used = current_time
+                    return key
+                self._schedule_dirty = True
 
-        if not healthy_keys:
             # Instead of marking all as healthy at once, mark one random key
             # This prevents thundering herd when all keys recover simultaneously
             all_keys = list(self._key_metrics.keys())
-            if all_keys:
-                # Select random key for recovery
-                recovery_key = random.choice(all_keys)
-                self._key_metrics[recovery_key].is_healthy = True
-                healthy_keys = [recovery_key]
-                self.logger.info(f"Staggered recovery: marking {recovery_key[:4]}**** as healthy")
-            else:
+            if not all_keys:
                 raise Exception("No keys available for rotation.")
 
-        if not healthy_keys:
-            raise Exception("No keys available for rotation.")
-
-        # Select random healthy key
-        key = random.choice(healthy_keys)
-        self._key_metrics[key].last_used = time.time()
-        return key
+            recovery_key = random.choice(all_keys)
+            metrics = self._key_metrics[recovery_key]
+            metrics.is_healthy = True
+            metrics.last_used = current_time
+            self._schedule_dirty = True
+            self.logger.info("Staggered recovery: marking %s**** as healthy", recovery_key[:4])
+            return recovery_key
 
     def update_key_metrics(
             self,
@@ -126,6 +185,8 @@ class HealthBasedStrategy(BaseRotationStrategy):
         if not metrics:
             return
 
+        was_healthy, old_weight = metrics.is_healthy, self._weight(metrics)
+
         # Update base metrics
         metrics.update_from_request(success, response_time, **kwargs)
 
@@ -133,14 +194,27 @@ class HealthBasedStrategy(BaseRotationStrategy):
         if not success and metrics.consecutive_failures >= self.failure_threshold:
             metrics.is_healthy = False
 
+        if metrics.is_healthy != was_healthy or self._weight(metrics) != old_weight:
+            self._schedule_dirty = True
+
     def update_keys(self, new_keys: List[str]) -> None:
         """Updates keys, adding metrics for new keys and removing stale ones."""
         with self._lock:
-            self._keys = list(new_keys)
+            self._keys = tuple(new_keys)
             new_set = set(new_keys)
             for key in list(self._key_metrics.keys()):
                 if key not in new_set:
                     del self._key_metrics[key]
             for key in new_keys:
                 if key not in self._key_metrics:
-                    self._key_metrics[key] = KeyMetrics(key)
\ No newline at end of file
+                    self._key_metrics[key] = KeyMetrics(key)
+            self._synced_metrics = None
+            self._schedule_dirty = True
+
+    def remove_key(self, key: str) -> bool:
+        """Removes a key together with its tracked metrics."""
+        with self._lock:
+            self._key_metrics.pop(key, None)
+            self._synced_metrics = None
+            self._schedule_dirty = True
+            return super().remove_key(key)
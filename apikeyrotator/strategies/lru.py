@@ -80,7 +80,7 @@ class LRURotationStrategy(BaseRotationStrategy):
     def update_keys(self, new_keys: List[str]) -> None:
         """Updates keys, adding metrics for new keys and removing stale ones."""
         with self._lock:
-            self._keys = list(new_keys)
+            self._keys = tuple(new_keys)
             new_set = set(new_keys)
             # Remove metrics for removed keys
             for key in list(self._key_metrics.keys()):
@@ -89,4 +89,10 @@ class LRURotationStrategy(BaseRotationStrategy):
             # Add metrics for new keys
             for key in new_keys:
                 if key not in self._key_metrics:
-                    self._key_metrics[key] = KeyMetrics(key)
\ No newline at end of file
+                    self._key_metrics[key] = KeyMetrics(key)
+
+    def remove_key(self, key: str) -> bool:
+        """Removes a key together with its tracked metrics."""
+        with self._lock:
+            self._key_metrics.pop(key, None)
+            return super().remove_key(key)
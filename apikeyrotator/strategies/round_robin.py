@@ -2,6 +2,8 @@
 Round Robin rotation strategy
 """
 
+import itertools
+import time
 from typing import List, Dict, Optional
 from .base import BaseRotationStrategy, KeyMetrics
 
@@ -30,16 +32,19 @@ class RoundRobinRotationStrategy(BaseRotationStrategy):
             ValueError: If the key list is empty
         """
         super().__init__(keys)
-        self._current_index = 0
+        # next() on a cycle runs in C and is atomic under the GIL, so picks
+        # need no lock. Rebuilt whenever the key set changes.
+        self._cycle = itertools.cycle(self._keys)
 
     def get_next_key(
             self,
             current_key_metrics: Optional[Dict[str, KeyMetrics]] = None
     ) -> str:
         """
-        Selects the next key in order.
+        Selects the next key in order, skipping unavailable keys.
         Args:
-            current_key_metrics: Not used in this strategy
+            current_key_metrics: Current metrics, used to skip unhealthy or
+                rate-limited keys (optional)
 
         Returns:
             str: Next key in the loop
@@ -47,25 +52,48 @@ class RoundRobinRotationStrategy(BaseRotationStrategy):
         Raises:
             ValueError: If no keys are available
         """
-        # Use single lock for entire operation to avoid potential deadlock
-        with self._lock:
-            if not self._keys:
-                raise ValueError("No keys available in rotation")
+        keys = self._keys
+        if not keys:
+            raise ValueError("No keys available in rotation")
 
-            # Get list of healthy keys
-            healthy_keys = self._get_healthy_keys(current_key_metrics)
+        cycle = self._cycle
+        if current_key_metrics is None:
+            return next(cycle)
 
-            if not healthy_keys:
-                # Fallback: use all keys if no healthy ones
-                healthy_keys = self._keys.copy()
+        now = time.time()
+        for _ in range(len(keys)):
+            key = next(cycle)
+            if self._is_available(current_key_metrics.get(key), now):
+                return key
 
-            # Ensure index is within list bounds
-            self._current_index = self._current_index % len(healthy_keys)
-            key = healthy_keys[self._current_index]
-            self._current_index = (self._current_index + 1) % len(healthy_keys)
+        # Fallback: use all keys if no healthy ones
+        return next(cycle)
 
-        return key
+    def _reset_cycle(self, old_keys: tuple) -> None:
+        """Rebuilds the cycle over the current keys, keeping its position."""
+        keys = self._keys
+        start = 0
+        # Resume at the first surviving key the old cycle would return next
+        for _ in range(len(old_keys)):
+            key = next(self._cycle)
+            if key in keys:
+                start = keys.index(key)
+                break
+        self._cycle = itertools.cycle(keys[start:] + keys[:start])
 
-    def __repr__(self):
+    def update_keys(self, new_keys: List[str]) -> None:
+        with self._lock:
+            old_keys = self._keys
+            super().update_keys(new_keys)
+            self._reset_cycle(old_keys)
+
+    def remove_key(self, key: str) -> bool:
         with self._lock:
-            return f"<RoundRobinStrategy keys={len(self._keys)} current_index={self._current_index}>"
\ No newline at end of file
+            old_keys = self._keys
+            removed = super().remove_key(key)
+            if removed:
+                self._reset_cycle(old_keys)
+            return removed
+
+    def __repr__(self):
+        return f"<RoundRobinStrategy keys={len(self._keys)}>"
@@ -72,7 +72,7 @@ class WeightedRotationStrategy(BaseRotationStrategy):
     def update_keys(self, new_keys: List[str]) -> None:
         """Updates available keys, preserving weights for existing keys."""
         with self._lock:
-            self._keys = list(new_keys)
+            self._keys = tuple(new_keys)
             # Filter weights to only keep existing keys
             self._keys_list = [k for k in new_keys if k in self._weights]
             self._weights_list = [self._weights[k] for k in self._keys_list]
@@ -81,4 +81,13 @@ class WeightedRotationStrategy(BaseRotationStrategy):
                 if k not in self._weights:
                     self._keys_list.append(k)
                     self._weights_list.append(1.0)
-                    self._weights[k] = 1.0
\ No newline at end of file
+                    self._weights[k] = 1.0
+
+    def remove_key(self, key: str) -> bool:
+        """Removes a key from the weighted pool; its weight is kept for re-adding."""
+        with self._lock:
+            if key in self._keys_list:
+                index = self._keys_list.index(key)
+                self._keys_list = self._keys_list[:index] + self._keys_list[index + 1:]
+                self._weights_list = self._weights_list[:index] + self._weights_list[index + 1:]
+            return super().remove_key(key)
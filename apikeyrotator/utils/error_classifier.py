@@ -21,6 +21,82 @@ class ErrorType(Enum):
     UNKNOWN = "unknown"
 
 
+def _classify_status_code(status_code: int) -> ErrorType:
+    """Maps an HTTP status code to its ErrorType (custom codes aside)."""
+    if status_code == 429:
+        # Too Many Requests - Rate Limit
+        return ErrorType.RATE_LIMIT
+
+    # FIXED: More detailed 4xx classification
+    elif status_code == 408:
+        # Request Timeout - temporary error, can retry
+        return ErrorType.TEMPORARY
+
+    elif status_code == 409:
+        # Conflict - may resolve on retry (e.g., concurrent updates)
+        return ErrorType.TEMPORARY
+
+    elif status_code == 425:
+        # Too Early - server not ready to process request, can retry
+        return ErrorType.TEMPORARY
+
+    elif status_code == 511:
+        # Can be temporary if network auth becomes available
+        # (e.g., captive portal, NTLM proxy)
+        return ErrorType.TEMPORARY
+
+    elif status_code in [401, 403]:
+        # Unauthorized, Forbidden - API key issue
+        return ErrorType.PERMANENT
+
+    elif status_code in [404, 410]:
+        # Not Found, Gone - resource does not exist (invalid endpoint)
+        return ErrorType.PERMANENT
+
+    elif status_code in [400, 405, 406, 411, 412, 413, 414, 415, 416, 417, 422, 428, 431]:
+        # Client errors related to malformed requests
+        # 400 Bad Request
+        # 405 Method Not Allowed
+        # 406 Not Acceptable
+        # 411 Length Required
+        # 412 Precondition Failed
+        # 413 Payload Too Large
+        # 414 URI Too Long
+        # 415 Unsupported Media Type
+        # 416 Range Not Satisfiable
+        # 417 Expectation Failed
+        # 422 Unprocessable Entity
+        # 428 Precondition Required
+        # 431 Request Header Fields Too Large
+        return ErrorType.PERMANENT
+
+    elif 400 <= status_code < 500:
+        # Other 4xx - considered permanent (bad request)
+        return ErrorType.PERMANENT
+
+    # Server errors
+    elif status_code in [500, 502, 503, 504]:
+        # Internal Server Error, Bad Gateway, Service Unavailable, Gateway Timeout
+        # Usually temporary issues
+        return ErrorType.TEMPORARY
+
+    elif status_code == 507:
+        # Insufficient Storage - may be temporary
+        return ErrorType.TEMPORARY
+
+    elif 500 <= status_code < 600:
+        # Other 5xx - considered temporary
+        return ErrorType.TEMPORARY
+
+    # 2xx, 3xx and other codes - not errors
+    return ErrorType.UNKNOWN
+
+
+# Every standard status code classified once; classify_error does a single
+# lookup and only falls back to the branches above for unusual values
+_STATUS_CODE_TYPES = {code: _classify_status_code(code) for code in range(100, 600)}
+
+
 class ErrorClassifier:
     """
     HTTP request error classifier.
@@ -103,74 +179,10 @@ class ErrorClassifier:
         if status_code in self.custom_retryable_codes:
             return ErrorType.TEMPORARY
 
-        # Classification by status code
-        if status_code == 429:
-            # Too Many Requests - Rate Limit
-            return ErrorType.RATE_LIMIT
-
-        # FIXED: More detailed 4xx classification
-        elif status_code == 408:
-            # Request Timeout - temporary error, can retry
-            return ErrorType.TEMPORARY
-
-        elif status_code == 409:
-            # Conflict - may resolve on retry (e.g., concurrent updates)
-            return ErrorType.TEMPORARY
-
-        elif status_code == 425:
-            # Too Early - server not ready to process request, can retry
-            return ErrorType.TEMPORARY
-
-        elif status_code == 511:
-            # Can be temporary if network auth becomes available
-            # (e.g., captive portal, NTLM proxy)
-            return ErrorType.TEMPORARY
-
-        elif status_code in [401, 403]:
-            # Unauthorized, Forbidden - API key issue
-            return ErrorType.PERMANENT
-
-        elif status_code in [404, 410]:
-            # Not Found, Gone - resource does not exist (invalid endpoint)
-            return ErrorType.PERMANENT
-
-        elif status_code in [400, 405, 406, 411, 412, 413, 414, 415, 416, 417, 422, 428, 431]:
-            # Client errors related to malformed requests
-            # 400 Bad Request
-            # 405 Method Not Allowed
-            # 406 Not Acceptable
-            # 411 Length Required
-            # 412 Precondition Failed
-            # 413 Payload Too Large
-            # 414 URI Too Long
-            # 415 Unsupported Media Type
-            # 416 Range Not Satisfiable
-            # 417 Expectation Failed
-            # 422 Unprocessable Entity
-            # 428 Precondition Required
-            # 431 Request Header Fields Too Large
-            return ErrorType.PERMANENT
-
-        elif 400 <= status_code < 500:
-            # Other 4xx - considered permanent (bad request)
-            return ErrorType.PERMANENT
-
-        # Server errors
-        elif status_code in [500, 502, 503, 504]:
-            # Internal Server Error, Bad Gateway, Service Unavailable, Gateway Timeout
-            # Usually temporary issues
-            return ErrorType.TEMPORARY
-
-        elif status_code == 507:
-            # Insufficient Storage - may be temporary
-            return ErrorType.TEMPORARY
-
-        elif 500 <= status_code < 600:
-            # Other 5xx - considered temporary
-            return ErrorType.TEMPORARY
-
-        # 2xx, 3xx and other codes - not errors
-        return ErrorType.UNKNOWN
+        error_type = _STATUS_CODE_TYPES.get(status_code)
+        if error_type is None:
+            error_type = _classify_status_code(status_code)
+        return error_type
 
     def is_retryable(
             self,
@@ -7,6 +7,7 @@ import pytest
 import os
 import sys
 import time
+import asyncio
 
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
@@ -61,6 +62,11 @@ class TestInitialization:
         assert len(rotator.keys) == 3
         assert rotator.keys == ["key1", "key2", "key3"]
 
+    def test_parse_keys_strips_and_skips_blanks(self):
+        from apikeyrotator import parse_keys
+        assert parse_keys(" key1 , ,key2,\tkey3 ,") == ["key1", "key2", "key3"]
+        assert parse_keys([" key1", "", None, "  ", "key2 "]) == ["key1", "key2"]
+
     @pytest.mark.skipif(not HAS_REQUESTS, reason="requests not installed")
     def test_no_api_keys(self):
         with pytest.raises(NoAPIKeysError):
@@ -110,6 +116,21 @@ class TestInitialization:
         assert rotator.base_delay == 2.0
         assert rotator.timeout == 30.0
 
+    @pytest.mark.skipif(not HAS_REQUESTS, reason="requests not installed")
+    def test_backoff_delay_is_capped(self):
+        rotator = APIKeyRotator(
+            api_keys=["key1"],
+            max_retries=10,
+            base_delay=1.0,
+            max_backoff=5.0,
+            load_env_file=False
+        )
+        assert 1.0 <= rotator._calculate_backoff_delay(0) <= 1.1
+        assert 5.0 <= rotator._calculate_backoff_delay(9) <= 5.5
+
+        rotator.max_backoff = 2.0
+        assert 2.0 <= rotator._calculate_backoff_delay(9) <= 2.2
+
 
 # ============================================================================
 # SYNCHRONOUS REQUEST TESTS
@@ -158,6 +179,14 @@ class TestSyncRequests:
             assert response.status_code == 204
             assert mock_request.call_args[0][0] == 'DELETE'
 
+    @pytest.mark.skipif(not HAS_REQUESTS, reason="requests not installed")
+    def test_method_is_normalized(self):
+        rotator = APIKeyRotator(api_keys=['key1'], load_env_file=False)
+        with patch('requests.Session.request') as mock_request:
+            mock_request.return_value = Mock(status_code=200, headers={}, content=b'')
+            rotator.request('patch', 'http://example.com')
+            assert mock_request.call_args[0][0] == 'PATCH'
+
     @pytest.mark.skipif(not HAS_REQUESTS, reason="requests not installed")
     def test_retry_on_failure(self):
         rotator = APIKeyRotator(api_keys=["key1"], max_retries=3, load_env_file=False)
@@ -191,6 +220,171 @@ class TestSyncRequests:
             response = rotator.get('http://example.com')
             assert response.status_code == 200
 
+    @pytest.mark.skipif(not HAS_REQUESTS, reason="requests not installed")
+    def test_rate_limit_waits_for_soonest_reset(self):
+        rotator = APIKeyRotator(api_keys=['key1', 'key2'], max_retries=5, load_env_file=False)
+        with patch('requests.Session.request') as mock_request, \
+                patch('time.sleep') as mock_sleep:
+            mock_request.side_effect = [
+                Mock(status_code=429, headers={'Retry-After': '5'}, content=b''),
+                Mock(status_code=429, headers={'Retry-After': '2'}, content=b''),
+                Mock(status_code=200, headers={}, content=b''),
+            ]
+            response = rotator.get('http://example.com')
+
+            assert response.status_code == 200
+            # The second key is tried at once; then only the reset is waited for
+            sent_with = [c.kwargs['headers']['Authorization'] for c in mock_request.call_args_list]
+            assert sent_with[:2] == ['Key key1', 'Key key2']
+            assert mock_sleep.call_count == 1
+            assert 1.5 < mock_sleep.call_args[0][0] <= 2.0
+
+    @pytest.mark.skipif(not HAS_REQUESTS, reason="requests not installed")
+    def test_rate_limit_reset_in_seconds(self):
+        rotator = APIKeyRotator(api_keys=['key1', 'key2'], max_retries=5, load_env_file=False)
+        with patch('requests.Session.request') as mock_request, \
+                patch('time.sleep') as mock_sleep:
+            mock_request.side_effect = [
+                Mock(status_code=429, headers={'X-RateLimit-Reset': '30'}, content=b''),
+                Mock(status_code=429, headers={'X-RateLimit-Reset': '30'}, content=b''),
+                Mock(status_code=200, headers={}, content=b''),
+            ]
+            response = rotator.get('http://example.com')
+
+            assert response.status_code == 200
+            assert rotator.key_manager.get_metrics_view()['key1'].rate_limit_reset > time.time() + 25
+            sent_with = [c.kwargs['headers']['Authorization'] for c in mock_request.call_args_list]
+            assert sent_with[:2] == ['Key key1', 'Key key2']
+            assert mock_sleep.call_count == 1
+            assert 25 < mock_sleep.call_args[0][0] <= 30
+
+    @pytest.mark.skipif(not HAS_REQUESTS, reason="requests not installed")
+    def test_rate_limit_reset_in_past_backs_off(self):
+        rotator = APIKeyRotator(api_keys=['key1'], max_retries=3, load_env_file=False)
+        with patch('requests.Session.request') as mock_request, \
+                patch('time.sleep') as mock_sleep:
+            mock_request.side_effect = [
+                Mock(status_code=429, headers={'X-RateLimit-Reset': '1000000000'}, content=b''),
+                Mock(status_code=200, headers={}, content=b''),
+            ]
+            rotator.get('http://example.com')
+
+            assert mock_sleep.call_count == 1
+            assert mock_sleep.call_args[0][0] > 0
+
+    @pytest.mark.skipif(not HAS_REQUESTS, reason="requests not installed")
+    def test_rate_limit_beyond_max_backoff_fails_fast(self):
+        rotator = APIKeyRotator(api_keys=['key1', 'key2'], max_retries=10, load_env_file=False)
+        with patch('requests.Session.request') as mock_request, \
+                patch('time.sleep') as mock_sleep:
+            mock_request.return_value = Mock(status_code=429, headers={'Retry-After': '3600'}, content=b'')
+            with pytest.raises(AllKeysExhaustedError):
+                rotator.get('http://example.com')
+
+            assert mock_request.call_count == 2
+            mock_sleep.assert_not_called()
+
+    @pytest.mark.skipif(not HAS_REQUESTS, reason="requests not installed")
+    def test_body_not_read_without_middleware(self):
+        rotator = APIKeyRotator(api_keys=['key1'], load_env_file=False)
+
+        class StreamingResponse:
+            status_code = 200
+            headers = {}
+
+            @property
+            def content(self):
+                raise AssertionError("body should not be materialized")
+
+        with patch('requests.Session.request', return_value=StreamingResponse()):
+            response = rotator.get('http://example.com', stream=True)
+            assert response.status_code == 200
+
+    @pytest.mark.skipif(not HAS_REQUESTS, reason="requests not installed")
+    def test_noop_middleware_hooks_are_skipped(self):
+        from apikeyrotator import RotatorMiddleware
+
+        class ErrorOnly(RotatorMiddleware):
+            def on_error_sync(self, error_info):
+                return False
+
+        class AfterOnly(RotatorMiddleware):
+            def __init__(self):
+                self.seen = []
+
+            def after_request_sync(self, response_info):
+                self.seen.append(response_info.status_code)
+                return response_info
+
+        after = AfterOnly()
+        rotator = APIKeyRotator(api_keys=['key1'], middlewares=[ErrorOnly(), after], load_env_file=False)
+        assert rotator._before_hooks_sync == ()
+        assert rotator._after_hooks_sync == (after.after_request_sync,)
+        # The async default forwards to the overridden sync hook
+        assert rotator._after_hooks_async == (after.after_request,)
+
+        with patch('requests.Session.request') as mock_request:
+            mock_request.return_value = Mock(status_code=200, headers={}, content=b'')
+            rotator.get('http://example.com')
+        assert after.seen == [200]
+
+    @pytest.mark.skipif(not HAS_REQUESTS, reason="requests not installed")
+    def test_saved_headers_follow_config_updates(self, tmp_path):
+        from apikeyrotator import ConfigLoader
+
+        loader = ConfigLoader(str(tmp_path / "config.json"))
+        loader.save_config({"successful_headers": {"example.com": {"X-Tenant": "1", "X-API-Key": "old"}}})
+        loader.load_config()
+        rotator = APIKeyRotator(
+            api_keys=['key1'], config_loader=loader, save_sensitive_headers=True, load_env_file=False
+        )
+
+        with patch('requests.Session.request') as mock_request:
+            mock_request.return_value = Mock(status_code=200, headers={}, content=b'')
+            rotator.get('http://example.com')
+            assert mock_request.call_args.kwargs['headers']['X-Tenant'] == '1'
+            assert mock_request.call_args.kwargs['headers']['Authorization'] == 'Key key1'
+
+            loader.update_config({"successful_headers": {"example.com": {"X-Tenant": "2"}}})
+            rotator.get('http://example.com')
+            assert mock_request.call_args.kwargs['headers']['X-Tenant'] == '2'
+
+    @pytest.mark.skipif(not HAS_REQUESTS, reason="requests not installed")
+    def test_add_middleware_resolves_hooks(self):
+        from apikeyrotator import RotatorMiddleware
+
+        class AfterOnly(RotatorMiddleware):
+            def after_request_sync(self, response_info):
+                return response_info
+
+        rotator = APIKeyRotator(api_keys=['key1'], load_env_file=False)
+        after = AfterOnly()
+
+        # In-place edits would bypass hook resolution, so they fail loudly
+        with pytest.raises(AttributeError):
+            rotator.middlewares.append(after)
+
+        rotator.add_middleware(after)
+        assert rotator.middlewares == (after,)
+        assert rotator._after_hooks_sync == (after.after_request_sync,)
+
+    @pytest.mark.skipif(not HAS_REQUESTS or not HAS_REQUESTS_MOCK, reason="missing deps")
+    def test_cache_sees_case_insensitive_headers(self):
+        import requests_mock as rm
+        from apikeyrotator import CachingMiddleware
+        cache = CachingMiddleware()
+        rotator = APIKeyRotator(api_keys=["key1"], middlewares=[cache], load_env_file=False)
+        with rm.Mocker() as m:
+            m.get("https://api.example.com/private", text="a", headers={"SET-COOKIE": "s=1"})
+            m.get("https://api.example.com/public", text="b", headers={"x-custom": "1"})
+            rotator.get("https://api.example.com/private")
+            rotator.get("https://api.example.com/public")
+
+            assert len(cache.cache) == 1
+            hit = rotator.get("https://api.example.com/public")
+            assert m.call_count == 2
+            assert hit.headers["X-Custom"] == "1"
+
 
 # ============================================================================
 # ASYNCHRONOUS REQUEST TESTS
@@ -237,6 +431,97 @@ class TestAsyncRequests:
         async with AsyncAPIKeyRotator(api_keys=['key1'], load_env_file=False) as rotator:
             assert rotator._session is not None
 
+    @pytest.mark.skipif(not HAS_AIOHTTP, reason="aiohttp not installed")
+    def test_async_session_per_event_loop(self):
+        rotator = AsyncAPIKeyRotator(api_keys=['key1'], load_env_file=False)
+
+        async def get_twice():
+            first = await rotator._get_session()
+            assert await rotator._get_session() is first
+            return first
+
+        first_loop = asyncio.new_event_loop()
+        second_loop = asyncio.new_event_loop()
+        try:
+            first = first_loop.run_until_complete(get_twice())
+            assert first.connector.limit == 100
+            second = second_loop.run_until_complete(get_twice())
+            assert second is not first
+            # The session left on the first loop is closed, not leaked
+            assert first.closed
+            second_loop.run_until_complete(second.close())
+        finally:
+            first_loop.close()
+            second_loop.close()
+
+    @pytest.mark.skipif(not HAS_AIOHTTP, reason="aiohttp not installed")
+    def test_async_session_reused_across_asyncio_run(self):
+        import gc
+        import warnings
+
+        rotator = AsyncAPIKeyRotator(api_keys=['key1'], load_env_file=False)
+
+        async def use_session():
+            await rotator._get_session()
+
+        async def close():
+            await rotator._session.close()
+
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter('always')
+            asyncio.run(use_session())
+            asyncio.run(use_session())
+            asyncio.run(close())
+            gc.collect()
+
+        assert not [w for w in caught if issubclass(w.category, ResourceWarning)]
+
+    @pytest.mark.skipif(not HAS_AIOHTTP, reason="aiohttp not installed")
+    @pytest.mark.asyncio
+    async def test_async_request_keyword_overrides(self):
+        async with AsyncAPIKeyRotator(
+            api_keys=['key1'], proxy_list=['http://proxy:8080'], load_env_file=False
+        ) as rotator:
+            async def mock_request(method, url, **kwargs):
+                resp = AsyncMock()
+                resp.status = 200
+                resp.headers = {}
+                resp.release = AsyncMock()
+                return resp
+
+            custom_headers = {'Accept': 'application/json'}
+            with patch('aiohttp.ClientSession.request', side_effect=mock_request) as mock:
+                await rotator.get('http://example.com', headers=custom_headers, params={'q': 1})
+
+            call_kwargs = mock.call_args[1]
+            assert call_kwargs['proxy'] == 'http://proxy:8080'
+            assert call_kwargs['params'] == {'q': 1}
+            assert call_kwargs['headers']['Accept'] == 'application/json'
+            assert custom_headers == {'Accept': 'application/json'}
+
+    @pytest.mark.skipif(not HAS_AIOHTTP, reason="aiohttp not installed")
+    @pytest.mark.asyncio
+    async def test_async_cache_hit_skips_network(self):
+        from apikeyrotator import CachingMiddleware
+
+        async with AsyncAPIKeyRotator(
+            api_keys=['key1'], middlewares=[CachingMiddleware()], load_env_file=False
+        ) as rotator:
+            async def mock_request(method, url, **kwargs):
+                resp = AsyncMock()
+                resp.status = 200
+                resp.headers = {'Content-Type': 'application/json'}
+                resp.read = AsyncMock(return_value=b'{"status": "ok"}')
+                resp.release = Mock()
+                return resp
+
+            with patch('aiohttp.ClientSession.request', side_effect=mock_request) as mock:
+                await rotator.get('http://example.com/data')
+                cached = await rotator.get('http://example.com/data')
+
+            assert mock.call_count == 1
+            assert await cached.json() == {"status": "ok"}
+
 
 # ============================================================================
 # CUSTOM CALLBACKS TESTS
@@ -307,6 +592,17 @@ class TestCustomCallbacks:
             assert headers['X-Custom'] == 'header'
             assert cookies['session'] == 'cookie_value'
 
+    @pytest.mark.skipif(not HAS_REQUESTS, reason="requests not installed")
+    def test_custom_headers_matched_case_insensitively(self):
+        rotator = APIKeyRotator(api_keys=['sk-test'], user_agents=['UA1'], load_env_file=False)
+
+        with patch('requests.Session.request') as mock_request:
+            mock_request.return_value = Mock(status_code=200, headers={}, content=b'')
+            rotator.get('http://example.com', headers={'authorization': 'Bearer mine', 'user-agent': 'Mine'})
+
+            headers = mock_request.call_args[1]['headers']
+            assert headers == {'authorization': 'Bearer mine', 'user-agent': 'Mine'}
+
 
 # ============================================================================
 # ANTI-BOT FEATURES TESTS
@@ -355,6 +651,25 @@ class TestAntiBotFeatures:
             # Should have delays
             assert mock_sleep.call_count >= 2
 
+    @pytest.mark.skipif(not HAS_REQUESTS, reason="requests not installed")
+    def test_random_delay_counts_time_since_last_send(self):
+        rotator = APIKeyRotator(
+            api_keys=['key1'],
+            random_delay_range=(0.01, 0.02),
+            load_env_file=False
+        )
+
+        with patch('requests.Session.request') as mock_request, \
+                patch('time.sleep') as mock_sleep:
+            mock_request.return_value = Mock(status_code=200, headers={}, content=b'')
+
+            rotator.get('http://example.com/1')
+            # The key was last used longer ago than the largest delay
+            rotator._last_sent['key1'] -= 1.0
+            rotator.get('http://example.com/2')
+
+            assert mock_sleep.call_count == 1
+
     @pytest.mark.skipif(not HAS_REQUESTS, reason="requests not installed")
     def test_proxy_rotation(self):
         proxies = ['http://proxy1:8080', 'http://proxy2:8080']
@@ -413,6 +728,17 @@ class TestEdgeCases:
             # key1 should be removed
             assert len(rotator.keys) == 1
 
+    @pytest.mark.skipif(not HAS_REQUESTS, reason="requests not installed")
+    def test_key_label_masks_and_is_dropped_with_key(self):
+        rotator = APIKeyRotator(api_keys=['sk-abcdef123', 'key2'], load_env_file=False)
+
+        label = rotator._key_label('sk-abcdef123')
+        assert label == 'sk-a****'
+        assert rotator._key_label('sk-abcdef123') is label
+
+        rotator._remove_invalid_key('sk-abcdef123')
+        assert 'sk-abcdef123' not in rotator._key_labels
+
     @pytest.mark.skipif(not HAS_REQUESTS, reason="requests not installed")
     def test_reset_key_health(self):
         rotator = APIKeyRotator(api_keys=['key1', 'key2'], load_env_file=False)
@@ -433,6 +759,35 @@ class TestEdgeCases:
         assert rotator._key_metrics['key1'].is_healthy is True
         assert rotator._key_metrics['key2'].is_healthy is True
 
+    @pytest.mark.skipif(not HAS_REQUESTS, reason="requests not installed")
+    def test_key_removal_keeps_old_snapshot_intact(self):
+        rotator = APIKeyRotator(api_keys=['key1', 'key2'], load_env_file=False)
+
+        keys_before = rotator.key_manager.get_keys_snapshot()
+        metrics_before = rotator.key_manager.get_metrics_view()
+
+        assert rotator.key_manager.remove_key('key1') is True
+        assert rotator.key_manager.remove_key('key1') is False
+
+        assert keys_before == ('key1', 'key2')
+        assert 'key1' in metrics_before
+        assert rotator.keys == ['key2']
+        assert 'key1' not in rotator.key_manager.get_metrics_view()
+        with pytest.raises(TypeError):
+            rotator.key_manager.get_metrics_view()['key3'] = None
+
+    @pytest.mark.skipif(not HAS_REQUESTS, reason="requests not installed")
+    def test_replacing_keys_keeps_metrics_of_surviving_keys(self):
+        rotator = APIKeyRotator(api_keys=['key1', 'key2'], load_env_file=False)
+        rotator._key_metrics['key2'].is_healthy = False
+
+        rotator.keys = ['key2', 'key3']
+
+        assert rotator.keys == ['key2', 'key3']
+        assert rotator._key_metrics['key2'].is_healthy is False
+        assert rotator._key_metrics['key3'].is_healthy is True
+        assert 'key1' not in rotator._key_metrics
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v", "-s"])
\ No newline at end of file
@@ -0,0 +1,152 @@
+"""
+ConfigLoader tests for APIKeyRotator
+Tests: JSON/YAML round-trips, missing files, unsupported formats
+"""
+
+import pytest
+import os
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from apikeyrotator import ConfigLoader
+
+
+# ============================================================================
+# CONFIG LOADER TESTS
+# ============================================================================
+
+class TestConfigLoader:
+    """Test loading and saving configuration files."""
+
+    def test_json_round_trip(self, tmp_path):
+        path = str(tmp_path / "config.json")
+        data = {"successful_headers": {"example.com": {"Accept": "application/json"}}, "name": "ключ"}
+
+        ConfigLoader(path).save_config(data)
+        assert ConfigLoader(path).load_config() == data
+
+    def test_yaml_round_trip(self, tmp_path):
+        path = str(tmp_path / "config.yaml")
+        data = {"keys": ["a", "b"], "strategy": "round_robin"}
+
+        ConfigLoader(path).save_config(data)
+        assert ConfigLoader(path).load_config() == data
+
+    def test_missing_file_returns_empty(self, tmp_path):
+        loader = ConfigLoader(str(tmp_path / "missing.json"))
+        assert loader.load_config() == {}
+
+    def test_save_creates_directory(self, tmp_path):
+        path = str(tmp_path / "nested" / "dir" / "config.json")
+        ConfigLoader(path).save_config({"a": 1})
+        assert os.path.exists(path)
+
+    def test_unsupported_format_on_save(self, tmp_path):
+        loader = ConfigLoader(str(tmp_path / "config.txt"))
+        with pytest.raises(ValueError):
+            loader.save_config({"a": 1})
+
+    def test_update_config(self, tmp_path):
+        path = str(tmp_path / "config.json")
+        loader = ConfigLoader(path)
+        loader.update_config({"a": 1})
+        loader.update_config({"b": 2})
+
+        assert ConfigLoader(path).load_config() == {"a": 1, "b": 2}
+
+    def test_cached_load_is_isolated(self, tmp_path):
+        path = str(tmp_path / "config.json")
+        ConfigLoader(path).save_config({"nested": {"a": 1}})
+
+        first = ConfigLoader(path).load_config()
+        first["nested"]["a"] = 999
+
+        assert ConfigLoader(path).load_config() == {"nested": {"a": 1}}
+
+    def test_reload_after_external_change(self, tmp_path):
+        path = str(tmp_path / "config.json")
+        ConfigLoader(path).save_config({"a": 1})
+        assert ConfigLoader(path).load_config() == {"a": 1}
+
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write('{"a": 1, "b": 22}')
+
+        assert ConfigLoader(path).load_config() == {"a": 1, "b": 22}
+
+    def test_deferred_updates_flush_once(self, tmp_path):
+        path = str(tmp_path / "config.json")
+        loader = ConfigLoader(path, autosave=False)
+        loader.update_config({"a": 1})
+        loader.update_config({"b": 2})
+
+        assert not os.path.exists(path)
+        assert loader.flush() is True
+        assert loader.flush() is False
+        assert ConfigLoader(path).load_config() == {"a": 1, "b": 2}
+
+    def test_save_leaves_no_temp_files(self, tmp_path):
+        path = str(tmp_path / "config.json")
+        loader = ConfigLoader(path)
+        loader.save_config({"a": 1})
+        loader.save_config({"a": 2})
+
+        assert os.listdir(str(tmp_path)) == ["config.json"]
+
+    def test_large_json_round_trip(self, tmp_path):
+        path = str(tmp_path / "config.json")
+        data = {"successful_headers": {f"host{i}.example.com": {"Accept": "*/*"} for i in range(5000)}}
+
+        ConfigLoader(path).save_config(data)
+        assert os.path.getsize(path) > 64 * 1024
+        assert ConfigLoader(path).load_config() == data
+        assert ConfigLoader(path).load_config() == data
+
+    def test_large_json_cache_hit_does_not_reparse(self, tmp_path):
+        from unittest.mock import patch
+        from apikeyrotator.core import config_loader
+
+        path = str(tmp_path / "config.json")
+        data = {"successful_headers": {f"host{i}.example.com": {"Accept": "*/*"} for i in range(5000)}}
+        ConfigLoader(path).save_config(data)
+        first = ConfigLoader(path).load_config()
+        first["successful_headers"].clear()
+
+        with patch.object(config_loader, '_load_json_mapped') as load_mapped, \
+                patch.object(config_loader, '_read_file_bytes') as read_bytes:
+            assert ConfigLoader(path).load_config() == data
+        load_mapped.assert_not_called()
+        read_bytes.assert_not_called()
+
+    def test_unchanged_save_skips_write(self, tmp_path):
+        path = str(tmp_path / "config.json")
+        loader = ConfigLoader(path)
+        loader.save_config({"a": 1})
+        mtime = os.stat(path).st_mtime_ns
+
+        loader.save_config({"a": 1})
+        assert os.stat(path).st_mtime_ns == mtime
+
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write('{"a": 2}')
+        loader.save_config({"a": 1})
+        assert ConfigLoader(path).load_config() == {"a": 1}
+
+    def test_noop_update_skips_write(self, tmp_path):
+        loader = ConfigLoader(str(tmp_path / "config.json"), autosave=False)
+        loader.update_config({"a": {"b": 1}})
+        assert loader.flush() is True
+
+        loader.update_config({"a": {"b": 1}})
+        assert loader.flush() is False
+
+    def test_update_with_nested_value_mutated_in_place(self, tmp_path):
+        path = str(tmp_path / "config.json")
+        ConfigLoader(path).save_config({"h": {"a": 1}})
+
+        loader = ConfigLoader(path)
+        cfg = loader.load_config()
+        cfg["h"]["b"] = 2
+        loader.update_config({"h": cfg["h"]})
+
+        assert ConfigLoader(path).load_config() == {"h": {"a": 1, "b": 2}}
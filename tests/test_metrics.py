@@ -158,6 +158,27 @@ class TestRotatorMetrics:
         assert metrics.failed_requests == 0
         assert len(metrics.endpoint_stats) == 0
 
+    def test_totals_across_threads(self):
+        import threading
+        metrics = RotatorMetrics()
+
+        def worker():
+            for i in range(100):
+                metrics.record_request("key1", "http://example.com", i % 4 != 0, 0.1)
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        # Shards of finished threads are folded, not lost
+        metrics.record_request("key1", "http://example.com", True, 0.1)
+
+        assert metrics.total_requests == 801
+        assert metrics.successful_requests == 601
+        assert metrics.failed_requests == 200
+
     def test_success_rate_calculation(self):
         metrics = RotatorMetrics()
 
@@ -297,6 +318,15 @@ class TestErrorClassifier:
             exception=ValueError("test")
         ) == ErrorType.UNKNOWN
 
+    def test_classify_uncommon_codes(self):
+        classifier = ErrorClassifier()
+
+        assert classifier.classify_error(response=MagicMock(status_code=418)) == ErrorType.PERMANENT
+        assert classifier.classify_error(response=MagicMock(status_code=599)) == ErrorType.TEMPORARY
+        assert classifier.classify_error(response=MagicMock(status_code=304)) == ErrorType.UNKNOWN
+        # Outside the precomputed range
+        assert classifier.classify_error(response=MagicMock(status_code=999)) == ErrorType.UNKNOWN
+
     def test_custom_retryable_codes(self):
         classifier = ErrorClassifier(custom_retryable_codes=[420, 509])
 
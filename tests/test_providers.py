@@ -40,6 +40,22 @@ class TestAWSSecretsManagerProvider:
 
     # ... [other tests in this class passed] ...
 
+    @pytest.mark.asyncio
+    async def test_get_keys_other_formats(self):
+        secrets = {
+            '{"api_keys": [" key1 ", "", 42]}': ['key1', '42'],
+            '{"keys": "key1, ,key2"}': ['key1', 'key2'],
+            '"key1,key2"': ['key1', 'key2'],
+            'key1, key2 ,': ['key1', 'key2'],
+        }
+        for secret, expected in secrets.items():
+            with patch('boto3.client') as mock_boto:
+                mock_client = Mock()
+                mock_client.get_secret_value.return_value = {'SecretString': secret}
+                mock_boto.return_value = mock_client
+                provider = AWSSecretsManagerProvider(secret_name='my-secret')
+                assert await provider.get_keys() == expected
+
     @pytest.mark.asyncio
     async def test_get_keys_secret_not_found(self):
         with patch('boto3.client') as mock_boto:
@@ -51,6 +67,23 @@ class TestAWSSecretsManagerProvider:
             keys = await provider.get_keys()
             assert keys == []
 
+    @pytest.mark.asyncio
+    async def test_get_keys_error_logged_with_traceback(self, caplog):
+        import logging
+
+        with patch('boto3.client') as mock_boto:
+            mock_client = Mock()
+            mock_client.get_secret_value.side_effect = RuntimeError('boom')
+            mock_client.exceptions.ResourceNotFoundException = KeyError
+            mock_boto.return_value = mock_client
+            provider = AWSSecretsManagerProvider(secret_name='my-secret')
+
+            with caplog.at_level(logging.ERROR):
+                assert await provider.get_keys() == []
+
+        record = next(r for r in caplog.records if 'my-secret' in r.getMessage())
+        assert record.exc_info is not None
+
     @pytest.mark.asyncio
     async def test_refresh_keys(self):
         mock_response = {'SecretString': '["key1", "key2"]'}
@@ -62,6 +95,28 @@ class TestAWSSecretsManagerProvider:
             keys = await provider.refresh_keys()
             assert keys == ['key1', 'key2']
 
+    @pytest.mark.asyncio
+    async def test_keys_cached_within_ttl(self):
+        mock_response = {'SecretString': '["key1", "key2"]'}
+        with patch('boto3.client') as mock_boto:
+            mock_client = Mock()
+            mock_client.get_secret_value.return_value = mock_response
+            mock_boto.return_value = mock_client
+            provider = AWSSecretsManagerProvider(secret_name='my-secret')
+
+            keys = await provider.get_keys()
+            keys.append('mutated')
+            assert await provider.refresh_keys() == ['key1', 'key2']
+            assert mock_client.get_secret_value.call_count == 1
+
+            await provider.refresh_keys(force_refresh=True)
+            assert mock_client.get_secret_value.call_count == 2
+
+            uncached = AWSSecretsManagerProvider(secret_name='my-secret', cache_ttl=0)
+            await uncached.get_keys()
+            await uncached.get_keys()
+            assert mock_client.get_secret_value.call_count == 4
+
     @pytest.mark.asyncio
     async def test_boto3_not_installed(self):
         """Test error when boto3 is not installed."""
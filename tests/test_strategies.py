@@ -17,6 +17,7 @@ from apikeyrotator.strategies import (
     WeightedRotationStrategy,
     LRURotationStrategy,
     HealthBasedStrategy,
+    BaseRotationStrategy,
     KeyMetrics,
 )
 
@@ -63,6 +64,33 @@ class TestRoundRobinStrategy:
         key = strategy.get_next_key(metrics)
         assert key == 'key2'
 
+    def test_round_robin_remove_key_keeps_position(self):
+        strategy = RoundRobinRotationStrategy(['key1', 'key2', 'key3'])
+        assert strategy.get_next_key() == 'key1'
+
+        assert strategy.remove_key('key3') is True
+        assert strategy.remove_key('key3') is False
+
+        keys = [strategy.get_next_key() for _ in range(4)]
+        assert keys == ['key2', 'key1', 'key2', 'key1']
+
+    def test_round_robin_even_across_threads(self):
+        import threading
+
+        strategy = RoundRobinRotationStrategy(['key1', 'key2', 'key3'])
+        picked = []
+
+        def worker():
+            picked.extend(strategy.get_next_key() for _ in range(300))
+
+        threads = [threading.Thread(target=worker) for _ in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert [picked.count(k) for k in ('key1', 'key2', 'key3')] == [400, 400, 400]
+
 
 # ============================================================================
 # RANDOM STRATEGY TESTS
@@ -165,6 +193,13 @@ class TestWeightedStrategy:
         # key2 should appear 3x more than key1
         assert count_key2 > count_key1 * 2
 
+    def test_weighted_remove_key(self):
+        strategy = WeightedRotationStrategy({'key1': 1, 'key2': 99})
+        strategy.remove_key('key2')
+
+        keys = {strategy.get_next_key() for _ in range(50)}
+        assert keys == {'key1'}
+
 
 # ============================================================================
 # LRU STRATEGY TESTS
@@ -217,6 +252,13 @@ class TestLRUStrategy:
         # All keys should be used
         assert keys_used == {'key1', 'key2', 'key3'}
 
+    def test_lru_remove_key_drops_metrics(self):
+        strategy = LRURotationStrategy(['key1', 'key2'])
+        strategy.remove_key('key1')
+
+        assert 'key1' not in strategy._key_metrics
+        assert strategy.get_next_key() == 'key2'
+
 
 # ============================================================================
 # HEALTH BASED STRATEGY TESTS
@@ -277,6 +319,26 @@ class TestHealthBasedStrategy:
         # After successful request, consecutive_failures should reset
         assert strategy._key_metrics['key1'].consecutive_failures == 0
 
+    def test_weighted_round_robin_by_success_rate(self):
+        strategy = HealthBasedStrategy(['key1', 'key2'])
+        strategy._key_metrics['key2'].success_rate = 0.45  # weight 5 vs 11
+
+        keys = [strategy.get_next_key() for _ in range(32)]
+
+        assert keys.count('key1') == 22
+        assert keys.count('key2') == 10
+        # Interleaved rather than in runs
+        assert 'key2' in keys[:8]
+
+    def test_key_turning_unhealthy_leaves_schedule(self):
+        strategy = HealthBasedStrategy(['key1', 'key2', 'key3'])
+        strategy.get_next_key()
+
+        strategy._key_metrics['key2'].is_healthy = False
+        strategy._key_metrics['key2'].last_used = time.time()
+
+        assert 'key2' not in [strategy.get_next_key() for _ in range(10)]
+
     def test_all_keys_unhealthy_recovery(self):
         strategy = HealthBasedStrategy(['key1', 'key2'], failure_threshold=1)
 
@@ -393,6 +455,32 @@ class TestKeyMetrics:
         assert 'avg_response_time' in data
 
 
+# ============================================================================
+# CUSTOM STRATEGY TESTS
+# ============================================================================
+
+class TestCustomStrategy:
+    """Test user-defined strategies built on BaseRotationStrategy."""
+
+    def test_remove_key_notifies_update_keys_override(self):
+        class Pinned(BaseRotationStrategy):
+            def __init__(self, keys):
+                super().__init__(keys)
+                self.current = keys[0]
+
+            def update_keys(self, new_keys):
+                super().update_keys(new_keys)
+                self.current = new_keys[0]
+
+            def get_next_key(self, current_key_metrics=None):
+                return self.current
+
+        strategy = Pinned(['key1', 'key2'])
+        assert strategy.remove_key('key1') is True
+        assert strategy.get_next_key() == 'key2'
+        assert strategy.remove_key('key1') is False
+
+
 # ============================================================================
 # STRATEGY FACTORY TESTS
 # ============================================================================